@@ -1,65 +1,120 @@
 # Main MCP server file
+import asyncio
+import importlib
 import logging
+import os
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
 
-from mcp.server.fastmcp import FastMCP
-
-# Import the interface and the concrete implementation
-from src.data_source_interface import FinancialDataSource
-from src.baostock_data_source import BaostockDataSource
-from src.utils import setup_logging
-
-# 导入各模块工具的注册函数
-from src.tools.stock_market import register_stock_market_tools
-from src.tools.financial_reports import register_financial_report_tools
-from src.tools.indices import register_index_tools
-from src.tools.market_overview import register_market_overview_tools
-from src.tools.macroeconomic import register_macroeconomic_tools
-from src.tools.date_utils import register_date_utils_tools
-from src.tools.analysis import register_analysis_tools
-from src.tools.helpers import register_helpers_tools
-
-# --- Logging Setup ---
-# Call the setup function from utils
-# You can control the default level here (e.g., logging.DEBUG for more verbose logs)
-setup_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# --- Dependency Injection ---
-# Instantiate the data source - easy to swap later if needed
-active_data_source: FinancialDataSource = BaostockDataSource()
+# --- Server Instructions ---
+def _today() -> str:
+    """Returns today's date in 'YYYY-MM-DD' format."""
+    return datetime.now().strftime("%Y-%m-%d")
 
-# --- Get current date for system prompt ---
-current_date = datetime.now().strftime("%Y-%m-%d")
 
-# --- FastMCP App Initialization ---
-app = FastMCP(
-    server_name="a_share_data_provider",
-    description=f"""今天是{current_date}。提供中国A股市场数据分析工具。此服务提供客观数据分析，用户需自行做出投资决策。数据分析基于公开市场信息，不构成投资建议，仅供参考。
+def _make_instructions(today: str) -> str:
+    """Builds the server instructions prompt for a given date; called once per process, when the app is built."""
+    return f"""今天是{today}。提供中国A股市场数据分析工具。此服务提供客观数据分析，用户需自行做出投资决策。数据分析基于公开市场信息，不构成投资建议，仅供参考。
 
 ⚠️ 重要说明:
 1. 最新交易日不一定是今天，需要从 get_latest_trading_date() 获取
 2. 请始终使用 get_latest_trading_date() 工具获取实际当前最近的交易日，不要依赖训练数据中的日期认知
 3. 当分析"最近"或"近期"市场情况时，必须首先调用 get_market_analysis_timeframe() 工具确定实际的分析时间范围
 4. 任何涉及日期的分析必须基于工具返回的实际数据，不得使用过时或假设的日期
-""",
-    # Specify dependencies for installation if needed (e.g., when using `mcp install`)
-    # dependencies=["baostock", "pandas"]
+"""
+
+# --- App Construction ---
+# The app is built lazily so that importing this module does not pull in FastMCP, pandas,
+# baostock and every tool module up front. The built app is cached in _APP, so calling
+# build_app() again (e.g. on reload) returns the same instance instead of re-registering tools.
+_APP: "FastMCP | None" = None
+
+# 各模块工具的注册函数: (module, register function, whether it takes the data source)
+_REGISTRARS = (
+    ("src.tools.stock_market", "register_stock_market_tools", True),
+    ("src.tools.financial_reports", "register_financial_report_tools", True),
+    ("src.tools.indices", "register_index_tools", True),
+    ("src.tools.market_overview", "register_market_overview_tools", True),
+    ("src.tools.macroeconomic", "register_macroeconomic_tools", True),
+    ("src.tools.date_utils", "register_date_utils_tools", True),
+    ("src.tools.analysis", "register_analysis_tools", True),
+    ("src.tools.helpers", "register_helpers_tools", False),
 )
 
-# --- 注册各模块的工具 ---
-register_stock_market_tools(app, active_data_source)
-register_financial_report_tools(app, active_data_source)
-register_index_tools(app, active_data_source)
-register_market_overview_tools(app, active_data_source)
-register_macroeconomic_tools(app, active_data_source)
-register_date_utils_tools(app, active_data_source)
-register_analysis_tools(app, active_data_source)
-register_helpers_tools(app)
+
+def build_app() -> "FastMCP":
+    """Creates the FastMCP app, wires in the data source and registers all tools (only once)."""
+    global _APP
+    if _APP is not None:
+        return _APP
+
+    # --- Logging Setup ---
+    # Configured here rather than at import time, so importing this module has no side effects.
+    # You can control the default level here (e.g., logging.DEBUG for more verbose logs)
+    from src.utils import setup_logging
+    setup_logging(level=logging.INFO)
+
+    from mcp.server.fastmcp import FastMCP
+
+    # Import the interface and the concrete implementation
+    from src.data_source_interface import FinancialDataSource
+    from src.baostock_data_source import BaostockDataSource
+    from src.caching_data_source import CachingDataSource
+
+    # --- Dependency Injection ---
+    # Instantiate the data source - easy to swap later if needed.
+    # Wrapped in a response cache so repeated tool calls do not hit Baostock again.
+    # Set A_SHARE_CACHE_DIR to also keep closed historical ranges on disk across restarts.
+    active_data_source: FinancialDataSource = CachingDataSource(
+        BaostockDataSource(), cache_dir=os.getenv("A_SHARE_CACHE_DIR") or None)
+
+    # --- FastMCP App Initialization ---
+    app = FastMCP(
+        name="a_share_data_provider",
+        instructions=_make_instructions(_today()),
+        # Specify dependencies for installation if needed (e.g., when using `mcp install`)
+        # dependencies=["baostock", "pandas"]
+    )
+
+    # --- 注册各模块的工具 ---
+    for module_name, register_name, needs_data_source in _REGISTRARS:
+        register = getattr(importlib.import_module(module_name), register_name)
+        if needs_data_source:
+            register(app, active_data_source)
+        else:
+            register(app)
+
+    _APP = app
+    return app
+
+
+def __getattr__(name: str):
+    """Builds the app on first access to `mcp_server.app` (PEP 562), e.g. for `mcp run` / `mcp dev`."""
+    if name == "app":
+        return build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _install_uvloop() -> None:
+    """Switches asyncio to uvloop when it is installed (it is optional and not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop.")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop.")
+
 
 # --- Main Execution Block ---
 if __name__ == "__main__":
-    logger.info(
-        f"Starting A-Share MCP Server via stdio... Today is {current_date}")
+    app = build_app()
+    _install_uvloop()
+    logger.info("Starting A-Share MCP Server via stdio... Today is %s", _today())
     # Run the server using stdio transport, suitable for MCP Hosts like Claude Desktop
     app.run(transport='stdio')
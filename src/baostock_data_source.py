@@ -1,9 +1,10 @@
 # Implementation of the FinancialDataSource interface using Baostock
 import baostock as bs
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
-from .data_source_interface import FinancialDataSource, DataSourceError, NoDataFoundError, LoginError
+from .data_source_interface import FinancialDataSource, DataSourceError, NoDataFoundError
 from .utils import baostock_login_context
 
 # Get a logger instance for this module
@@ -14,115 +15,240 @@ DEFAULT_K_FIELDS = [
     "volume", "amount", "adjustflag", "turn", "tradestatus",
     "pctChg", "peTTM", "pbMRQ", "psTTM", "pcfNcfTTM", "isST"
 ]
+# Joined once; this is what Baostock receives when no fields are requested
+_DEFAULT_K_FIELDS_STR = ",".join(DEFAULT_K_FIELDS)
+
+# K-data fields that Baostock returns as numeric strings; parsed to float64 (missing values become NaN).
+# Flag fields such as adjustflag, tradestatus and isST are kept as strings.
+K_NUMERIC_FIELDS = frozenset({
+    "open", "high", "low", "close", "preclose", "volume", "amount",
+    "turn", "pctChg", "peTTM", "pbMRQ", "psTTM", "pcfNcfTTM"
+})
+
+# Adjustment factor fields returned as numeric strings
+ADJUST_FACTOR_NUMERIC_FIELDS = frozenset({
+    "foreAdjustFactor", "backAdjustFactor", "adjustFactor"
+})
+
+# Low-cardinality flag columns stored as pandas categoricals (a few distinct strings instead of one object per row)
+TRADE_DATE_CATEGORY_FIELDS = frozenset({"is_trading_day"})
+ALL_STOCK_CATEGORY_FIELDS = frozenset({"tradeStatus"})
+INDUSTRY_CATEGORY_FIELDS = frozenset({"industry", "industryClassification"})
 
 DEFAULT_BASIC_FIELDS = [
     "code", "tradeStatus", "code_name"
     # Add more default fields as needed, e.g., "industry", "listingDate"
 ]
 
-# Helper function to reduce repetition in financial data fetching
-
+# Numeric fields of the quarterly financial datasets (code, pubDate and statDate stay strings)
+PROFIT_NUMERIC_FIELDS = frozenset({
+    "roeAvg", "npMargin", "gpMargin", "netProfit", "epsTTM", "MBRevenue", "totalShare", "liqaShare"
+})
+OPERATION_NUMERIC_FIELDS = frozenset({
+    "NRTurnRatio", "NRTurnDays", "INVTurnRatio", "INVTurnDays", "CATurnRatio", "AssetTurnRatio"
+})
+GROWTH_NUMERIC_FIELDS = frozenset({
+    "YOYEquity", "YOYAsset", "YOYNI", "YOYEPSBasic", "YOYPNI"
+})
+BALANCE_NUMERIC_FIELDS = frozenset({
+    "currentRatio", "quickRatio", "cashRatio", "YOYLiability", "liabilityToAsset", "assetToEquity"
+})
+CASH_FLOW_NUMERIC_FIELDS = frozenset({
+    "CAToAsset", "NCAToAsset", "tangibleAssetToAsset", "ebitToInterest", "CFOToOR", "CFOToNP", "CFOToGr"
+})
+DUPONT_NUMERIC_FIELDS = frozenset({
+    "dupontROE", "dupontAssetStoEquity", "dupontAssetTurn", "dupontPnitoni", "dupontNitogr",
+    "dupontTaxBurden", "dupontIntburden", "dupontEbittogr"
+})
+
+# Quarterly financial datasets: kind -> (Baostock query function, display name, numeric fields)
+FINANCIAL_QUERIES = {
+    "profit": (bs.query_profit_data, "Profitability", PROFIT_NUMERIC_FIELDS),
+    "operation": (bs.query_operation_data, "Operation Capability", OPERATION_NUMERIC_FIELDS),
+    "growth": (bs.query_growth_data, "Growth Capability", GROWTH_NUMERIC_FIELDS),
+    "balance": (bs.query_balance_data, "Balance Sheet", BALANCE_NUMERIC_FIELDS),
+    "cash_flow": (bs.query_cash_flow_data, "Cash Flow", CASH_FLOW_NUMERIC_FIELDS),
+    "dupont": (bs.query_dupont_data, "DuPont Analysis", DUPONT_NUMERIC_FIELDS),
+}
+
+# Baostock error codes / messages that mean "the query matched nothing" rather than a failure
+_NO_DATA_CODES = frozenset({'10002'})
+_NO_DATA_MARKERS = ("no record found", "no data")
+
+
+def _is_no_data_message(error_msg: str) -> bool:
+    """Returns True if a Baostock error message says the query matched nothing."""
+    msg = error_msg.casefold()
+    return any(marker in msg for marker in _NO_DATA_MARKERS)
+
+
+def _check_rs(rs, what: str, context: str) -> None:
+    """Raises NoDataFoundError or DataSourceError if a Baostock result set reports an error."""
+    if rs.error_code == '0':
+        return
+    logger.error(
+        "Baostock API error (%s) for %s: %s (code: %s)", what, context, rs.error_msg, rs.error_code)
+    # Cheap code check first; only casefold the message (once) when it does not match
+    if rs.error_code in _NO_DATA_CODES or _is_no_data_message(rs.error_msg):
+        raise NoDataFoundError(
+            f"No {what} found for {context}. Baostock msg: {rs.error_msg}")
+    raise DataSourceError(
+        f"Baostock API error fetching {what}: {rs.error_msg} (code: {rs.error_code})")
+
+
+def _read_rows(rs, what: str, context: str, keep_idx: Optional[List[int]] = None) -> List[List[str]]:
+    """Returns all rows of a (successful) Baostock result set, raising NoDataFoundError if there are none."""
+    data_list = _drain_resultset(rs, keep_idx)
+    if not data_list:
+        logger.warning("No %s found for %s (empty result set from Baostock).", what, context)
+        raise NoDataFoundError(f"No {what} found for {context} (empty result set).")
+    return data_list
+
+
+def _drain_resultset(rs, keep_idx: Optional[List[int]] = None) -> List[List[str]]:
+    """
+    Reads every remaining row from a Baostock result set (rs.next() fetches further pages as needed).
 
-def _fetch_financial_data(
-    bs_query_func,
-    data_type_name: str,
-    code: str,
-    year: str,
-    quarter: int
+    If keep_idx is given, only those column positions are kept from each row.
+    """
+    rows = []
+    # Bind the methods once instead of looking them up for every row
+    append = rows.append
+    has_next = rs.next
+    get_row = rs.get_row_data
+    if keep_idx is None:
+        while has_next():
+            append(get_row())
+    else:
+        while has_next():
+            row = get_row()
+            append([row[i] for i in keep_idx])
+    return rows
+
+
+def _select_columns(available: List[str], requested: List[str], what: str) -> Tuple[List[str], List[int]]:
+    """Returns the requested columns that exist (in requested order) and their positions in `available`."""
+    positions = {name: i for i, name in enumerate(available)}
+    columns = [name for name in requested if name in positions]
+    if not columns:
+        raise ValueError(
+            f"None of the requested fields {requested} are available in the {what} result.")
+    return columns, [positions[name] for name in columns]
+
+
+def _build_frame(
+    data_list: List[List[str]],
+    columns: List[str],
+    numeric_fields: frozenset,
+    category_fields: frozenset = frozenset(),
 ) -> pd.DataFrame:
-    logger.info(
-        f"Fetching {data_type_name} data for {code}, year={year}, quarter={quarter}")
-    try:
-        with baostock_login_context():
-            # Assuming all these functions take code, year, quarter
-            rs = bs_query_func(code=code, year=year, quarter=quarter)
-
-            if rs.error_code != '0':
-                logger.error(
-                    f"Baostock API error ({data_type_name}) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                    raise NoDataFoundError(
-                        f"No {data_type_name} data found for {code}, {year}Q{quarter}. Baostock msg: {rs.error_msg}")
-                else:
-                    raise DataSourceError(
-                        f"Baostock API error fetching {data_type_name} data: {rs.error_msg} (code: {rs.error_code})")
-
-            data_list = []
-            while rs.next():
-                data_list.append(rs.get_row_data())
-
-            if not data_list:
-                logger.warning(
-                    f"No {data_type_name} data found for {code}, {year}Q{quarter} (empty result set from Baostock).")
-                raise NoDataFoundError(
-                    f"No {data_type_name} data found for {code}, {year}Q{quarter} (empty result set).")
-
-            result_df = pd.DataFrame(data_list, columns=rs.fields)
-            logger.info(
-                f"Retrieved {len(result_df)} {data_type_name} records for {code}, {year}Q{quarter}.")
-            return result_df
-
-    except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-        logger.warning(
-            f"Caught known error fetching {data_type_name} data for {code}: {type(e).__name__}")
-        raise e
-    except Exception as e:
-        logger.exception(
-            f"Unexpected error fetching {data_type_name} data for {code}: {e}")
-        raise DataSourceError(
-            f"Unexpected error fetching {data_type_name} data for {code}: {e}")
+    """
+    Builds a DataFrame from Baostock rows one column array at a time.
 
-# Helper function to reduce repetition for index constituent data fetching
+    Columns listed in numeric_fields are parsed from strings to numbers (missing values
+    become NaN) and those in category_fields become categoricals before the frame exists;
+    copy=False lets pandas adopt the arrays as they are, instead of building an object
+    frame and replacing columns afterwards.
+    """
+    arrays = {}
+    for name, values in zip(columns, zip(*data_list)):
+        # Baostock returns every value as a string, so skip numpy's per-cell type inference
+        array = np.array(values, dtype=object)
+        if name in numeric_fields:
+            array = pd.to_numeric(array, errors="coerce")
+        elif name in category_fields:
+            array = pd.Categorical(array)
+        arrays[name] = array
+    return pd.DataFrame(arrays, columns=columns, copy=False)
+
+
+# Baostock error codes meaning the login or connection was lost (not logged in, network errors 10002001-10002008).
+# A query failing with one of these is retried once on a fresh session.
+_SESSION_ERROR_CODES = frozenset({"10001001"} | {f"1000200{i}" for i in range(1, 9)})
+
+
+class _SessionLost(Exception):
+    """
+    Raised inside baostock_login_context so the broken session is dropped before retrying.
+    Unlike DataSourceError, which leaves the session open, it makes the context manager log out.
+    """
 
 
-def _fetch_index_constituent_data(
+def _run_query(
     bs_query_func,
-    index_name: str,
-    date: Optional[str] = None
+    query_kwargs: dict,
+    what: str,
+    context: str,
+    numeric_fields: frozenset = frozenset(),
+    select: Optional[List[str]] = None,
+    category_fields: frozenset = frozenset(),
 ) -> pd.DataFrame:
-    logger.info(
-        f"Fetching {index_name} constituents for date={date or 'latest'}")
+    """
+    Runs a single Baostock query and returns all of its rows as a DataFrame.
+
+    Args:
+        bs_query_func: The Baostock query function, e.g. bs.query_dividend_data.
+        query_kwargs: Keyword arguments for the query function.
+        what: Name of the dataset for logs and error messages, e.g. "dividend data".
+        context: Description of the query for logs and error messages, e.g. "sh.600000, year 2023".
+        numeric_fields: Columns to convert from strings to float64.
+        select: Optional subset of result columns to keep; the others are dropped while reading rows.
+        category_fields: Columns to store as pandas categoricals.
+
+    Raises:
+        LoginError, NoDataFoundError, DataSourceError, ValueError: Passed through unchanged.
+        DataSourceError: Wrapping any other unexpected error.
+    """
+    logger.info("Fetching %s for %s", what, context)
     try:
-        with baostock_login_context():
-            # date is optional, defaults to latest
-            rs = bs_query_func(date=date)
-
-            if rs.error_code != '0':
-                logger.error(
-                    f"Baostock API error ({index_name} Constituents) for date {date}: {rs.error_msg} (code: {rs.error_code})")
-                if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                    raise NoDataFoundError(
-                        f"No {index_name} constituent data found for date {date}. Baostock msg: {rs.error_msg}")
-                else:
-                    raise DataSourceError(
-                        f"Baostock API error fetching {index_name} constituents: {rs.error_msg} (code: {rs.error_code})")
-
-            data_list = []
-            while rs.next():
-                data_list.append(rs.get_row_data())
-
-            if not data_list:
-                logger.warning(
-                    f"No {index_name} constituent data found for date {date} (empty result set).")
-                raise NoDataFoundError(
-                    f"No {index_name} constituent data found for date {date} (empty result set).")
-
-            result_df = pd.DataFrame(data_list, columns=rs.fields)
-            logger.info(
-                f"Retrieved {len(result_df)} {index_name} constituents for date {date or 'latest'}.")
-            return result_df
-
-    except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-        logger.warning(
-            f"Caught known error fetching {index_name} constituents for date {date}: {type(e).__name__}")
-        raise e
+        for attempt in range(2):
+            try:
+                with baostock_login_context():
+                    rs = bs_query_func(**query_kwargs)
+                    if rs.error_code in _SESSION_ERROR_CODES:
+                        raise _SessionLost(f"{rs.error_msg} (code: {rs.error_code})")
+
+                    _check_rs(rs, what, context)
+                    # Crucial: Use rs.fields for column names
+                    columns, keep_idx = rs.fields, None
+                    if select:
+                        columns, keep_idx = _select_columns(rs.fields, select, what)
+                    data_list = _read_rows(rs, what, context, keep_idx)
+
+                    result_df = _build_frame(data_list, columns, numeric_fields, category_fields)
+                    logger.info("Retrieved %d %s records for %s.", len(result_df), what, context)
+                    return result_df
+            except _SessionLost as e:
+                # The session was already dropped on the way out of baostock_login_context
+                if attempt:
+                    logger.error("Baostock session lost again while fetching %s for %s: %s", what, context, e)
+                    raise DataSourceError(f"Baostock API error fetching {what}: {e}") from e
+                logger.warning("Baostock session lost while fetching %s (%s); logging in again and retrying.", what, e)
+
+    except (DataSourceError, ValueError):
+        # Known errors (incl. LoginError / NoDataFoundError) propagate as-is; the tool runner logs them
+        raise
     except Exception as e:
+        # Use logger.exception to include traceback
         logger.exception(
-            f"Unexpected error fetching {index_name} constituents for date {date}: {e}")
+            "Unexpected error fetching %s for %s: %s", what, context, e)
         raise DataSourceError(
-            f"Unexpected error fetching {index_name} constituents for date {date}: {e}")
+            f"Unexpected error fetching {what} for {context}: {e}") from e
+
+
+def _fetch_financial_data(
+    bs_query_func, data_type_name: str, numeric_fields: frozenset, code: str, year: str, quarter: int
+) -> pd.DataFrame:
+    return _run_query(
+        bs_query_func, dict(code=code, year=year, quarter=quarter),
+        f"{data_type_name} data", f"{code}, {year}Q{quarter}", numeric_fields=numeric_fields)
+
 
-# Helper function to reduce repetition for macroeconomic data fetching
+def _fetch_index_constituent_data(bs_query_func, index_name: str, date: Optional[str] = None) -> pd.DataFrame:
+    # date is optional, defaults to latest
+    return _run_query(
+        bs_query_func, dict(date=date),
+        f"{index_name} constituent data", f"date {date or 'latest'}")
 
 
 def _fetch_macro_data(
@@ -132,48 +258,10 @@ def _fetch_macro_data(
     end_date: Optional[str] = None,
     **kwargs  # For extra params like yearType
 ) -> pd.DataFrame:
-    date_range_log = f"from {start_date or 'default'} to {end_date or 'default'}"
     kwargs_log = f", extra_args={kwargs}" if kwargs else ""
-    logger.info(f"Fetching {data_type_name} data {date_range_log}{kwargs_log}")
-    try:
-        with baostock_login_context():
-            rs = bs_query_func(start_date=start_date,
-                               end_date=end_date, **kwargs)
-
-            if rs.error_code != '0':
-                logger.error(
-                    f"Baostock API error ({data_type_name}): {rs.error_msg} (code: {rs.error_code})")
-                if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                    raise NoDataFoundError(
-                        f"No {data_type_name} data found for the specified criteria. Baostock msg: {rs.error_msg}")
-                else:
-                    raise DataSourceError(
-                        f"Baostock API error fetching {data_type_name} data: {rs.error_msg} (code: {rs.error_code})")
-
-            data_list = []
-            while rs.next():
-                data_list.append(rs.get_row_data())
-
-            if not data_list:
-                logger.warning(
-                    f"No {data_type_name} data found for the specified criteria (empty result set).")
-                raise NoDataFoundError(
-                    f"No {data_type_name} data found for the specified criteria (empty result set).")
-
-            result_df = pd.DataFrame(data_list, columns=rs.fields)
-            logger.info(
-                f"Retrieved {len(result_df)} {data_type_name} records.")
-            return result_df
-
-    except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-        logger.warning(
-            f"Caught known error fetching {data_type_name} data: {type(e).__name__}")
-        raise e
-    except Exception as e:
-        logger.exception(
-            f"Unexpected error fetching {data_type_name} data: {e}")
-        raise DataSourceError(
-            f"Unexpected error fetching {data_type_name} data: {e}")
+    return _run_query(
+        bs_query_func, dict(start_date=start_date, end_date=end_date, **kwargs),
+        f"{data_type_name} data", f"{start_date or 'default'} to {end_date or 'default'}{kwargs_log}")
 
 
 class BaostockDataSource(FinancialDataSource):
@@ -181,17 +269,22 @@ class BaostockDataSource(FinancialDataSource):
     Concrete implementation of FinancialDataSource using the Baostock library.
     """
 
-    def _format_fields(self, fields: Optional[List[str]], default_fields: List[str]) -> str:
-        """Formats the list of fields into a comma-separated string for Baostock."""
-        if fields is None or not fields:
+    # Stateless: the Baostock session lives in src/utils.py
+    __slots__ = ()
+
+    def _format_fields(self, fields: Optional[List[str]], default_fields: str) -> str:
+        """Formats the list of fields into a comma-separated string for Baostock (default_fields is pre-joined)."""
+        if not fields:
             logger.debug(
-                f"No specific fields requested, using defaults: {default_fields}")
-            return ",".join(default_fields)
-        # Basic validation: ensure requested fields are strings
-        if not all(isinstance(f, str) for f in fields):
-            raise ValueError("All items in the fields list must be strings.")
-        logger.debug(f"Using requested fields: {fields}")
-        return ",".join(fields)
+                "No specific fields requested, using defaults: %s", default_fields)
+            return default_fields
+        # Basic validation: str.join itself rejects non-string items
+        try:
+            formatted = ",".join(fields)
+        except TypeError:
+            raise ValueError("All items in the fields list must be strings.") from None
+        logger.debug("Using requested fields: %s", formatted)
+        return formatted
 
     def get_historical_k_data(
         self,
@@ -203,369 +296,87 @@ class BaostockDataSource(FinancialDataSource):
         fields: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """Fetches historical K-line data using Baostock."""
-        logger.info(
-            f"Fetching K-data for {code} ({start_date} to {end_date}), freq={frequency}, adjust={adjust_flag}")
-        try:
-            formatted_fields = self._format_fields(fields, DEFAULT_K_FIELDS)
-            logger.debug(
-                f"Requesting fields from Baostock: {formatted_fields}")
-
-            with baostock_login_context():
-                rs = bs.query_history_k_data_plus(
-                    code,
-                    formatted_fields,
-                    start_date=start_date,
-                    end_date=end_date,
-                    frequency=frequency,
-                    adjustflag=adjust_flag
-                )
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (K-data) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    # Check common error codes, e.g., for no data
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':  # Example error code
-                        raise NoDataFoundError(
-                            f"No historical data found for {code} in the specified range. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching K-data: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No historical data found for {code} in range (empty result set from Baostock).")
-                    raise NoDataFoundError(
-                        f"No historical data found for {code} in the specified range (empty result set).")
-
-                # Crucial: Use rs.fields for column names
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(f"Retrieved {len(result_df)} records for {code}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            # Re-raise known errors
-            logger.warning(
-                f"Caught known error fetching K-data for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            # Wrap unexpected errors
-            # Use logger.exception to include traceback
-            logger.exception(
-                f"Unexpected error fetching K-data for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching K-data for {code}: {e}")
+        formatted_fields = self._format_fields(fields, _DEFAULT_K_FIELDS_STR)
+        return _run_query(
+            bs.query_history_k_data_plus,
+            dict(code=code, fields=formatted_fields, start_date=start_date, end_date=end_date,
+                 frequency=frequency, adjustflag=adjust_flag),
+            "historical K-data",
+            f"{code} ({start_date} to {end_date}, freq={frequency}, adjust={adjust_flag})",
+            numeric_fields=K_NUMERIC_FIELDS,
+        )
 
     def get_stock_basic_info(self, code: str, fields: Optional[List[str]] = None) -> pd.DataFrame:
         """Fetches basic stock information using Baostock."""
-        logger.info(f"Fetching basic info for {code}")
-        try:
-            # Note: query_stock_basic doesn't seem to have a fields parameter in docs,
-            # but we keep the signature consistent. It returns a fixed set.
-            # We will use the `fields` argument post-query to select columns if needed.
-            logger.debug(
-                f"Requesting basic info for {code}. Optional fields requested: {fields}")
-
-            with baostock_login_context():
-                # Example: Fetch basic info; adjust API call if needed based on baostock docs
-                # rs = bs.query_stock_basic(code=code, code_name=code_name) # If supporting name lookup
-                rs = bs.query_stock_basic(code=code)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Basic Info) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No basic info found for {code}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching basic info: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No basic info found for {code} (empty result set from Baostock).")
-                    raise NoDataFoundError(
-                        f"No basic info found for {code} (empty result set).")
-
-                # Crucial: Use rs.fields for column names
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved basic info for {code}. Columns: {result_df.columns.tolist()}")
-
-                # Optional: Select subset of columns if `fields` argument was provided
-                if fields:
-                    available_cols = [
-                        col for col in fields if col in result_df.columns]
-                    if not available_cols:
-                        raise ValueError(
-                            f"None of the requested fields {fields} are available in the basic info result.")
-                    logger.debug(
-                        f"Selecting columns: {available_cols} from basic info for {code}")
-                    result_df = result_df[available_cols]
-
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching basic info for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching basic info for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching basic info for {code}: {e}")
+        # Note: query_stock_basic doesn't seem to have a fields parameter in docs,
+        # but we keep the signature consistent. It returns a fixed set.
+        # The `fields` argument selects columns while the rows are read.
+        result_df = _run_query(
+            bs.query_stock_basic, dict(code=code), "basic info", code, select=fields)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Basic info columns for %s: %s", code, result_df.columns.tolist())
+        return result_df
 
     def get_dividend_data(self, code: str, year: str, year_type: str = "report") -> pd.DataFrame:
         """Fetches dividend information using Baostock."""
-        logger.info(
-            f"Fetching dividend data for {code}, year={year}, year_type={year_type}")
-        try:
-            with baostock_login_context():
-                rs = bs.query_dividend_data(
-                    code=code, year=year, yearType=year_type)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Dividend) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No dividend data found for {code} and year {year}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching dividend data: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No dividend data found for {code}, year {year} (empty result set from Baostock).")
-                    raise NoDataFoundError(
-                        f"No dividend data found for {code}, year {year} (empty result set).")
-
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} dividend records for {code}, year {year}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching dividend data for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching dividend data for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching dividend data for {code}: {e}")
+        return _run_query(
+            bs.query_dividend_data, dict(code=code, year=year, yearType=year_type),
+            "dividend data", f"{code}, year {year} ({year_type})")
 
     def get_adjust_factor_data(self, code: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Fetches adjustment factor data using Baostock."""
-        logger.info(
-            f"Fetching adjustment factor data for {code} ({start_date} to {end_date})")
-        try:
-            with baostock_login_context():
-                rs = bs.query_adjust_factor(
-                    code=code, start_date=start_date, end_date=end_date)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Adjust Factor) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No adjustment factor data found for {code} in the specified range. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching adjust factor data: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No adjustment factor data found for {code} in range (empty result set from Baostock).")
-                    raise NoDataFoundError(
-                        f"No adjustment factor data found for {code} in the specified range (empty result set).")
-
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} adjustment factor records for {code}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching adjust factor data for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching adjust factor data for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching adjust factor data for {code}: {e}")
+        return _run_query(
+            bs.query_adjust_factor, dict(code=code, start_date=start_date, end_date=end_date),
+            "adjustment factor data", f"{code} ({start_date} to {end_date})",
+            numeric_fields=ADJUST_FACTOR_NUMERIC_FIELDS)
 
     def get_profit_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly profitability data using Baostock."""
-        return _fetch_financial_data(bs.query_profit_data, "Profitability", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["profit"], code, year, quarter)
 
     def get_operation_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly operation capability data using Baostock."""
-        return _fetch_financial_data(bs.query_operation_data, "Operation Capability", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["operation"], code, year, quarter)
 
     def get_growth_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly growth capability data using Baostock."""
-        return _fetch_financial_data(bs.query_growth_data, "Growth Capability", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["growth"], code, year, quarter)
 
     def get_balance_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly balance sheet data (solvency) using Baostock."""
-        return _fetch_financial_data(bs.query_balance_data, "Balance Sheet", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["balance"], code, year, quarter)
 
     def get_cash_flow_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly cash flow data using Baostock."""
-        return _fetch_financial_data(bs.query_cash_flow_data, "Cash Flow", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["cash_flow"], code, year, quarter)
 
     def get_dupont_data(self, code: str, year: str, quarter: int) -> pd.DataFrame:
         """Fetches quarterly DuPont analysis data using Baostock."""
-        return _fetch_financial_data(bs.query_dupont_data, "DuPont Analysis", code, year, quarter)
+        return _fetch_financial_data(*FINANCIAL_QUERIES["dupont"], code, year, quarter)
 
     def get_performance_express_report(self, code: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Fetches performance express reports (业绩快报) using Baostock."""
-        logger.info(
-            f"Fetching Performance Express Report for {code} ({start_date} to {end_date})")
-        try:
-            with baostock_login_context():
-                rs = bs.query_performance_express_report(
-                    code=code, start_date=start_date, end_date=end_date)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Perf Express) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No performance express report found for {code} in range {start_date}-{end_date}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching performance express report: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No performance express report found for {code} in range {start_date}-{end_date} (empty result set).")
-                    raise NoDataFoundError(
-                        f"No performance express report found for {code} in range {start_date}-{end_date} (empty result set).")
+        return _run_query(
+            bs.query_performance_express_report, dict(code=code, start_date=start_date, end_date=end_date),
+            "performance express report", f"{code} ({start_date} to {end_date})")
 
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} performance express report records for {code}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching performance express report for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching performance express report for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching performance express report for {code}: {e}")
 
     def get_forecast_report(self, code: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Fetches performance forecast reports (业绩预告) using Baostock."""
-        logger.info(
-            f"Fetching Performance Forecast Report for {code} ({start_date} to {end_date})")
-        try:
-            with baostock_login_context():
-                rs = bs.query_forecast_report(
-                    code=code, start_date=start_date, end_date=end_date)
-                # Note: Baostock docs mention pagination for this, but the Python API doesn't seem to expose it directly.
-                # We fetch all available pages in the loop below.
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Forecast) for {code}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No performance forecast report found for {code} in range {start_date}-{end_date}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching performance forecast report: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():  # Loop should handle pagination implicitly if rs manages it
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No performance forecast report found for {code} in range {start_date}-{end_date} (empty result set).")
-                    raise NoDataFoundError(
-                        f"No performance forecast report found for {code} in range {start_date}-{end_date} (empty result set).")
+        # Note: Baostock docs mention pagination for this, but the Python API doesn't seem to expose it directly.
+        # _run_query fetches all available pages through rs.next().
+        return _run_query(
+            bs.query_forecast_report, dict(code=code, start_date=start_date, end_date=end_date),
+            "performance forecast report", f"{code} ({start_date} to {end_date})")
 
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} performance forecast report records for {code}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching performance forecast report for {code}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching performance forecast report for {code}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching performance forecast report for {code}: {e}")
 
     def get_stock_industry(self, code: Optional[str] = None, date: Optional[str] = None) -> pd.DataFrame:
         """Fetches industry classification using Baostock."""
-        log_msg = f"Fetching industry data for code={code or 'all'}, date={date or 'latest'}"
-        logger.info(log_msg)
-        try:
-            with baostock_login_context():
-                rs = bs.query_stock_industry(code=code, date=date)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Industry) for {code}, {date}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':
-                        raise NoDataFoundError(
-                            f"No industry data found for {code}, {date}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching industry data: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No industry data found for {code}, {date} (empty result set).")
-                    raise NoDataFoundError(
-                        f"No industry data found for {code}, {date} (empty result set).")
+        return _run_query(
+            bs.query_stock_industry, dict(code=code, date=date),
+            "industry data", f"code={code or 'all'}, date={date or 'latest'}",
+            category_fields=INDUSTRY_CATEGORY_FIELDS)
 
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} industry records for {code or 'all'}, {date or 'latest'}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching industry data for {code}, {date}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching industry data for {code}, {date}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching industry data for {code}, {date}: {e}")
 
     def get_sz50_stocks(self, date: Optional[str] = None) -> pd.DataFrame:
         """Fetches SZSE 50 index constituents using Baostock."""
@@ -581,85 +392,19 @@ class BaostockDataSource(FinancialDataSource):
 
     def get_trade_dates(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
         """Fetches trading dates using Baostock."""
-        logger.info(
-            f"Fetching trade dates from {start_date or 'default'} to {end_date or 'default'}")
-        try:
-            with baostock_login_context():  # Login might not be strictly needed for this, but keeping consistent
-                rs = bs.query_trade_dates(
-                    start_date=start_date, end_date=end_date)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (Trade Dates): {rs.error_msg} (code: {rs.error_code})")
-                    # Unlikely to have 'no record found' for dates, but handle API errors
-                    raise DataSourceError(
-                        f"Baostock API error fetching trade dates: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    # This case should ideally not happen if the API returns a valid range
-                    logger.warning(
-                        f"No trade dates returned for range {start_date}-{end_date} (empty result set).")
-                    raise NoDataFoundError(
-                        f"No trade dates found for range {start_date}-{end_date} (empty result set).")
-
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(f"Retrieved {len(result_df)} trade date records.")
-                return result_df
+        return _run_query(
+            bs.query_trade_dates, dict(start_date=start_date, end_date=end_date),
+            "trade dates", f"{start_date or 'default'} to {end_date or 'default'}",
+            category_fields=TRADE_DATE_CATEGORY_FIELDS)
 
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching trade dates: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(f"Unexpected error fetching trade dates: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching trade dates: {e}")
 
     def get_all_stock(self, date: Optional[str] = None) -> pd.DataFrame:
         """Fetches all stock list for a given date using Baostock."""
-        logger.info(f"Fetching all stock list for date={date or 'default'}")
-        try:
-            with baostock_login_context():
-                rs = bs.query_all_stock(day=date)
-
-                if rs.error_code != '0':
-                    logger.error(
-                        f"Baostock API error (All Stock) for date {date}: {rs.error_msg} (code: {rs.error_code})")
-                    if "no record found" in rs.error_msg.lower() or rs.error_code == '10002':  # Check if this applies
-                        raise NoDataFoundError(
-                            f"No stock data found for date {date}. Baostock msg: {rs.error_msg}")
-                    else:
-                        raise DataSourceError(
-                            f"Baostock API error fetching all stock list: {rs.error_msg} (code: {rs.error_code})")
-
-                data_list = []
-                while rs.next():
-                    data_list.append(rs.get_row_data())
-
-                if not data_list:
-                    logger.warning(
-                        f"No stock list returned for date {date} (empty result set).")
-                    raise NoDataFoundError(
-                        f"No stock list found for date {date} (empty result set).")
+        return _run_query(
+            bs.query_all_stock, dict(day=date),
+            "stock list", f"date {date or 'default'}",
+            category_fields=ALL_STOCK_CATEGORY_FIELDS)
 
-                result_df = pd.DataFrame(data_list, columns=rs.fields)
-                logger.info(
-                    f"Retrieved {len(result_df)} stock records for date {date or 'default'}.")
-                return result_df
-
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(
-                f"Caught known error fetching all stock list for date {date}: {type(e).__name__}")
-            raise e
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error fetching all stock list for date {date}: {e}")
-            raise DataSourceError(
-                f"Unexpected error fetching all stock list for date {date}: {e}")
 
     def get_deposit_rate_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
         """Fetches benchmark deposit rates using Baostock."""
@@ -696,7 +441,7 @@ class BaostockDataSource(FinancialDataSource):
         - Cash Flow (现金流量)
         - DuPont Analysis (杜邦分析)
         """
-        logger.info(f"Fetching aggregated financial indicators for {code} ({start_date} to {end_date})")
+        logger.info("Fetching aggregated financial indicators for %s (%s to %s)", code, start_date, end_date)
 
         # 解析日期范围，获取年份列表
         from datetime import datetime
@@ -730,7 +475,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"profit_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch profit data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch profit data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 2. 营运能力
                         try:
@@ -740,7 +485,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"operation_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch operation data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch operation data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 3. 成长能力
                         try:
@@ -750,7 +495,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"growth_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch growth data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch growth data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 4. 偿债能力
                         try:
@@ -760,7 +505,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"balance_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch balance data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch balance data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 5. 现金流量
                         try:
@@ -770,7 +515,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"cashflow_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch cash flow data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch cash flow data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 6. 杜邦分析
                         try:
@@ -780,7 +525,7 @@ class BaostockDataSource(FinancialDataSource):
                                 for i, field in enumerate(rs.fields):
                                     record[f"dupont_{field}"] = row[i] if i < len(row) else None
                         except Exception as e:
-                            logger.debug(f"Failed to fetch dupont data for {code} {year}Q{quarter}: {e}")
+                            logger.debug("Failed to fetch dupont data for %s %sQ%s: %s", code, year, quarter, e)
 
                         # 只有当有数据时才添加记录
                         if len(record) > 3:  # code + year + quarter + at least one data field
@@ -791,14 +536,13 @@ class BaostockDataSource(FinancialDataSource):
                         f"No financial indicator data found for {code} in range {start_date}-{end_date}")
 
                 result_df = pd.DataFrame(all_results)
-                logger.info(f"Retrieved {len(result_df)} aggregated financial indicator records for {code}.")
+                logger.info("Retrieved %d aggregated financial indicator records for %s.", len(result_df), code)
                 return result_df
 
-        except (LoginError, NoDataFoundError, DataSourceError, ValueError) as e:
-            logger.warning(f"Known error fetching financial indicators for {code}: {type(e).__name__}")
-            raise e
+        except (DataSourceError, ValueError):
+            raise
         except Exception as e:
-            logger.exception(f"Unexpected error fetching financial indicators for {code}: {e}")
-            raise DataSourceError(f"Unexpected error fetching financial indicators for {code}: {e}")
+            logger.exception("Unexpected error fetching financial indicators for %s: %s", code, e)
+            raise DataSourceError(f"Unexpected error fetching financial indicators for {code}: {e}") from e
 
     # Note: SHIBOR is not available in current Baostock API bindings used; not implemented.
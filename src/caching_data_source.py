@@ -0,0 +1,310 @@
+# Caching proxy that wraps any FinancialDataSource implementation
+import hashlib
+import inspect
+import logging
+import math
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Union
+
+import pandas as pd
+
+from .data_source_interface import FinancialDataSource
+
+# Get a logger instance for this module
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = timedelta(hours=6)
+DEFAULT_CACHE_MAXSIZE = 512
+# K-data for a range reaching today still gains bars during the session
+LIVE_CACHE_TTL = timedelta(seconds=60)
+
+_MISSING = object()
+
+# Methods whose result for a date range that ended before today never changes
+# (not get_adjust_factor_data: foreAdjustFactor of past rows is recomputed after every ex-dividend date)
+_RANGE_METHODS = frozenset({"get_historical_k_data", "get_trade_dates"})
+# Methods returning a snapshot as of `date`, fixed once that day is over
+_SNAPSHOT_METHODS = frozenset({
+    "get_all_stock", "get_stock_industry", "get_hs300_stocks", "get_sz50_stocks", "get_zz500_stocks"
+})
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts list arguments (e.g. `fields`) to tuples so they can be part of a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _copy_result(result: Any) -> Any:
+    """Hands out a shallow copy so callers adding or replacing columns never touch the cached frame."""
+    if isinstance(result, pd.DataFrame):
+        return result.copy(deep=False)
+    return result
+
+
+class _TTLCache:
+    """A small thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+
+    __slots__ = ("_maxsize", "_ttl_seconds", "_entries", "_lock")
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value for key, or _MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """Stores value under key; ttl_seconds overrides the default TTL (math.inf never expires)."""
+        if ttl_seconds is None:
+            ttl_seconds = self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _DiskCache:
+    """
+    Pickle files under a directory, used for results that never change
+    (closed historical ranges), so they survive server restarts.
+    """
+
+    __slots__ = ("_directory",)
+
+    # Bump when the stored DataFrame layout changes, to ignore files written by older versions
+    _VERSION = "1"
+
+    def __init__(self, directory: Union[str, Path]):
+        self._directory = Path(directory).expanduser()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: Hashable) -> Path:
+        digest = hashlib.blake2b(f"{self._VERSION}|{key!r}".encode("utf-8"), digest_size=16).hexdigest()
+        return self._directory / f"{digest}.pkl"
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the stored value for key, or _MISSING if there is none (or it cannot be read)."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return _MISSING
+
+    def set(self, key: Hashable, value: Any) -> None:
+        path = self._path(key)
+        tmp_name = None
+        try:
+            # Write to a temporary file first so readers never see a partial pickle
+            fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except Exception as e:
+            logger.warning("Could not write cache file %s: %s", path, e)
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def clear(self) -> None:
+        """Deletes every stored result file (other files in the directory are left alone)."""
+        for path in self._directory.glob("*.pkl"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning("Could not delete cache file %s: %s", path, e)
+
+
+def _cached(method_name: str) -> Callable:
+    """Builds a proxy method that serves `method_name` from the cache, calling the wrapped source on a miss."""
+    def method(self, *args, **kwargs):
+        return self._call(method_name, args, kwargs)
+
+    method.__name__ = method_name
+    method.__qualname__ = f"CachingDataSource.{method_name}"
+    method.__doc__ = f"Cached proxy for FinancialDataSource.{method_name}."
+    return method
+
+
+class CachingDataSource(FinancialDataSource):
+    """
+    FinancialDataSource proxy that memoizes the results of a wrapped data source.
+
+    Every interface method is cached on its method name and bound arguments for
+    `ttl`, keeping at most `maxsize` results (least recently used are evicted first).
+    K-data and trade calendars for a range that ended before today, and stock
+    list / industry / index constituent snapshots of a past date, are immutable
+    and never expire (forward-adjusted K-data excepted, as those prices shift with
+    every new ex-dividend date; adjustment factors keep the default TTL for the
+    same reason). K-data for a range that reaches
+    today is kept for `live_ttl` only, so intraday bars stay fresh. If `cache_dir` is given, these
+    immutable results are also stored on disk and reused across restarts.
+    Concurrent calls with the same key are coalesced: only the first caller hits
+    the wrapped source, the others wait for its result (or its exception).
+    Exceptions are never cached. Attributes that are not part of the interface
+    are forwarded to the wrapped source without caching.
+    """
+
+    __slots__ = ("_source", "_cache", "_live_ttl_seconds", "_disk", "_signatures", "_in_flight", "_in_flight_lock")
+
+    def __init__(
+        self,
+        source: FinancialDataSource,
+        ttl: timedelta = DEFAULT_CACHE_TTL,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        cache_dir: Optional[Union[str, Path]] = None,
+        live_ttl: timedelta = LIVE_CACHE_TTL,
+    ):
+        self._source = source
+        self._cache = _TTLCache(maxsize=maxsize, ttl_seconds=ttl.total_seconds())
+        self._live_ttl_seconds = live_ttl.total_seconds()
+        self._disk: Optional[_DiskCache] = None
+        if cache_dir:
+            try:
+                self._disk = _DiskCache(cache_dir)
+            except OSError as e:
+                logger.warning("Disk cache disabled, cannot use %s: %s", cache_dir, e)
+        self._signatures: dict[str, inspect.Signature] = {}
+        self._in_flight: dict[Hashable, Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _bind(self, method_name: str, args: tuple, kwargs: dict) -> dict:
+        """Maps a call's arguments to parameter names (defaults applied), so positional and keyword calls share a key."""
+        signature = self._signatures.get(method_name)
+        if signature is None:
+            signature = inspect.signature(getattr(self._source, method_name))
+            self._signatures[method_name] = signature
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound.arguments
+
+    def _ttl_for(self, method_name: str, params: dict) -> float | None:
+        """Returns a TTL override for this call, or None for the default TTL."""
+        if method_name in _RANGE_METHODS:
+            end_date = params.get("end_date")
+            today = datetime.now().strftime("%Y-%m-%d")
+            if end_date and end_date < today:
+                # adjust_flag '2' is forward-adjusted (前复权): past prices change after each ex-dividend date
+                return math.inf if params.get("adjust_flag") != "2" else None
+            if method_name == "get_historical_k_data":
+                return self._live_ttl_seconds
+        elif method_name in _SNAPSHOT_METHODS:
+            # A snapshot of a past day never changes; date=None means "latest" and keeps the default TTL
+            date = params.get("date")
+            if date and date < datetime.now().strftime("%Y-%m-%d"):
+                return math.inf
+        return None
+
+    def _call(self, method_name: str, args: tuple, kwargs: dict) -> Any:
+        params = self._bind(method_name, args, kwargs)
+        key = (method_name, tuple((name, _freeze(value)) for name, value in params.items()))
+        cached = self._cache.get(key)
+        if cached is not _MISSING:
+            logger.debug("Cache hit for %s", method_name)
+            return _copy_result(cached)
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                # The previous owner may have filled the cache just before we took the lock
+                cached = self._cache.get(key)
+                if cached is not _MISSING:
+                    return _copy_result(cached)
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            logger.debug("Waiting for in-flight call to %s", method_name)
+            return _copy_result(future.result())
+
+        try:
+            # Inside the try: if this raises, waiters must still be released through the future
+            ttl_seconds = self._ttl_for(method_name, params)
+            use_disk = self._disk is not None and ttl_seconds == math.inf
+            result = self._disk.get(key) if use_disk else _MISSING
+            if result is not _MISSING:
+                logger.debug("Disk cache hit for %s", method_name)
+            else:
+                logger.debug("Cache miss for %s", method_name)
+                result = getattr(self._source, method_name)(*args, **kwargs)
+                if use_disk:
+                    self._disk.set(key, result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._cache.set(key, result, ttl_seconds=ttl_seconds)
+            future.set_result(result)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(key, None)
+        return _copy_result(result)
+
+    def clear_cache(self) -> None:
+        """Drops every cached result, in memory and (if enabled) on disk."""
+        self._cache.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        return getattr(self._source, name)
+
+    get_historical_k_data = _cached("get_historical_k_data")
+    get_stock_basic_info = _cached("get_stock_basic_info")
+    get_trade_dates = _cached("get_trade_dates")
+    get_all_stock = _cached("get_all_stock")
+    get_deposit_rate_data = _cached("get_deposit_rate_data")
+    get_loan_rate_data = _cached("get_loan_rate_data")
+    get_required_reserve_ratio_data = _cached("get_required_reserve_ratio_data")
+    get_money_supply_data_month = _cached("get_money_supply_data_month")
+    get_money_supply_data_year = _cached("get_money_supply_data_year")
+    get_dividend_data = _cached("get_dividend_data")
+    get_adjust_factor_data = _cached("get_adjust_factor_data")
+
+    # Financial report datasets
+    get_profit_data = _cached("get_profit_data")
+    get_operation_data = _cached("get_operation_data")
+    get_growth_data = _cached("get_growth_data")
+    get_balance_data = _cached("get_balance_data")
+    get_cash_flow_data = _cached("get_cash_flow_data")
+    get_dupont_data = _cached("get_dupont_data")
+    get_performance_express_report = _cached("get_performance_express_report")
+    get_forecast_report = _cached("get_forecast_report")
+    get_fina_indicator = _cached("get_fina_indicator")
+
+    # Index / industry
+    get_stock_industry = _cached("get_stock_industry")
+    get_hs300_stocks = _cached("get_hs300_stocks")
+    get_sz50_stocks = _cached("get_sz50_stocks")
+    get_zz500_stocks = _cached("get_zz500_stocks")
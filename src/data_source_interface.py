@@ -25,6 +25,9 @@ class FinancialDataSource(ABC):
     (e.g., Baostock, Akshare).
     """
 
+    # Empty slots so subclasses can opt out of a per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def get_historical_k_data(
         self,
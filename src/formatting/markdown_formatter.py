@@ -1,6 +1,9 @@
 """
 Markdown formatting utilities for A-Share MCP Server.
 """
+import csv
+import io
+import numpy as np
 import pandas as pd
 import logging
 import json
@@ -10,6 +13,44 @@ logger = logging.getLogger(__name__)
 # Configuration: Max rows to display in string outputs to protect context length
 MAX_MARKDOWN_ROWS = 250
 
+# Shared stand-in for a missing DataFrame; never modified
+_EMPTY_DF = pd.DataFrame()
+
+
+def _column_text(col: pd.Series) -> np.ndarray:
+    """Returns a column as an array of cell strings; missing values become empty cells."""
+    values = col.to_numpy()
+    if pd.api.types.is_float_dtype(col.dtype):
+        # %.15g keeps every significant digit and drops the trailing '.0' of whole numbers
+        text = np.char.mod("%.15g", values.astype(np.float64))
+        return np.where(np.isnan(values), "", text)
+    return col.astype(object).where(col.notna(), "").astype(str).to_numpy().astype(str)
+
+
+def _to_markdown_table(df: pd.DataFrame) -> str:
+    """
+    Renders a DataFrame as a pipe table in the layout of tabulate's 'pipe' format
+    (numeric columns right-aligned, text left-aligned), one numpy column at a time.
+    """
+    header_cells, separator_cells, columns = [], [], []
+    for i, name in enumerate(df.columns):
+        col = df.iloc[:, i]
+        text = _column_text(col)
+        header = str(name)
+        width = max(len(header), int(np.char.str_len(text).max(initial=0)))
+        if pd.api.types.is_numeric_dtype(col.dtype) and not pd.api.types.is_bool_dtype(col.dtype):
+            header_cells.append(header.rjust(width))
+            separator_cells.append("-" * (width + 1) + ":")
+            columns.append(np.char.rjust(text, width))
+        else:
+            header_cells.append(header.ljust(width))
+            separator_cells.append(":" + "-" * (width + 1))
+            columns.append(np.char.ljust(text, width))
+
+    lines = ["| " + " | ".join(header_cells) + " |", "|" + "|".join(separator_cells) + "|"]
+    lines.extend("| " + " | ".join(row) + " |" for row in zip(*columns))
+    return "\n".join(lines)
+
 
 def format_df_to_markdown(df: pd.DataFrame, max_rows: int = None) -> str:
     """Formats a Pandas DataFrame to a Markdown string with row truncation.
@@ -35,7 +76,7 @@ def format_df_to_markdown(df: pd.DataFrame, max_rows: int = None) -> str:
     truncated = original_rows > rows_to_show
 
     try:
-        markdown_table = df_display.to_markdown(index=False)
+        markdown_table = _to_markdown_table(df_display)
     except Exception as e:
         logger.error("Error converting DataFrame to Markdown: %s", e, exc_info=True)
         return "Error: Could not format data into Markdown table."
@@ -46,6 +87,104 @@ def format_df_to_markdown(df: pd.DataFrame, max_rows: int = None) -> str:
     return markdown_table
 
 
+def _format_markdown(df_display: pd.DataFrame, total_rows: int, max_rows: int, meta: dict | None) -> str:
+    if not meta:
+        return format_df_to_markdown(df_display, max_rows=max_rows)
+    # Render a compact meta header
+    header = "Meta:\n" + "\n".join(f"- {k}: {v}" for k, v in meta.items()) + "\n\n"
+    return header + format_df_to_markdown(df_display, max_rows=max_rows)
+
+
+# TOON separators that must not appear inside a cell; the backslash is escaped first so escapes stay unambiguous
+_TOON_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def _toon_escape(text: str) -> str:
+    for raw, escaped in _TOON_ESCAPES:
+        text = text.replace(raw, escaped)
+    return text
+
+
+def _toon_column(col: pd.Series) -> np.ndarray:
+    text = _column_text(col)
+    if pd.api.types.is_numeric_dtype(col.dtype):
+        # Numbers never contain separators
+        return text
+    for raw, escaped in _TOON_ESCAPES:
+        text = np.char.replace(text, raw, escaped)
+    return text
+
+
+def _format_toon(df_display: pd.DataFrame, total_rows: int, max_rows: int, meta: dict | None) -> str:
+    """
+    Compact table for model consumers: the column names once, then one tab-separated
+    line per row, without the padding and pipes markdown spends tokens on.
+    Tabs, newlines and backslashes inside cells are written as \\t, \\n and \\\\.
+    """
+    header = "".join(f"{k}: {_toon_escape(str(v))}\n" for k, v in meta.items()) if meta else ""
+    if df_display.empty:
+        return header + "(No data available to display)"
+    try:
+        lines = ["\t".join(_toon_escape(str(name)) for name in df_display.columns), "---"]
+        columns = [_toon_column(df_display.iloc[:, i]) for i in range(df_display.shape[1])]
+        lines.extend("\t".join(row) for row in zip(*columns))
+    except Exception as e:
+        logger.error("Error converting DataFrame to TOON: %s", e, exc_info=True)
+        return "Error: Could not format data into TOON table."
+    if total_rows > df_display.shape[0]:
+        header += f"truncated: {df_display.shape[0]} of {total_rows} rows\n"
+    return header + "\n".join(lines)
+
+
+def _format_csv(df_display: pd.DataFrame, total_rows: int, max_rows: int, meta: dict | None) -> str:
+    try:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(df_display.columns)
+        # Missing values become None, which csv writes as an empty field (like to_csv)
+        columns = [col.astype(object).where(col.notna(), None).to_numpy() for _, col in df_display.items()]
+        writer.writerows(zip(*columns))
+        return buf.getvalue()
+    except Exception as e:
+        logger.error("Error converting DataFrame to CSV: %s", e, exc_info=True)
+        return "Error: Could not format data into CSV."
+
+
+def _json_default(value):
+    """Serializes values json.dumps does not know, e.g. timestamps as ISO strings."""
+    isoformat = getattr(value, "isoformat", None)
+    return isoformat() if isoformat is not None else str(value)
+
+
+def _format_json(df_display: pd.DataFrame, total_rows: int, max_rows: int, meta: dict | None) -> str:
+    try:
+        # json.dumps writes floats with their shortest repr (1234.56 stays 1234.56), unlike
+        # to_json's fixed double_precision; missing values become None -> null
+        records = df_display.astype(object).where(df_display.notna(), None).to_dict("records")
+        data_json = json.dumps(records, ensure_ascii=False, default=_json_default)
+        returned_rows = int(df_display.shape[0])
+        meta_json = json.dumps({
+            **(meta or {}),
+            "total_rows": total_rows,
+            "returned_rows": returned_rows,
+            "truncated": total_rows > returned_rows,
+            "columns": list(df_display.columns),
+        }, ensure_ascii=False)
+        return f'{{"data": {data_json}, "meta": {meta_json}}}'
+    except Exception as e:
+        logger.error("Error converting DataFrame to JSON: %s", e, exc_info=True)
+        return "Error: Could not format data into JSON."
+
+
+# Output format -> formatter(df_display, total_rows, max_rows, meta)
+_FORMATTERS = {
+    "markdown": _format_markdown,
+    "csv": _format_csv,
+    "json": _format_json,
+    "toon": _format_toon,
+}
+
+
 def format_table_output(
     df: pd.DataFrame,
     format: str = "markdown",
@@ -56,58 +195,26 @@ def format_table_output(
 
     Args:
         df: Data to format.
-        format: 'markdown' | 'json' | 'csv'. Defaults to 'markdown'.
-        max_rows: Optional max rows to include (defaults depend on formatters).
+        format: 'markdown' | 'json' | 'csv' | 'toon'. Defaults to 'markdown'.
+        max_rows: Optional max rows to include (defaults to MAX_MARKDOWN_ROWS).
         meta: Optional metadata dict to include (prepended for markdown, embedded for json).
 
     Returns:
         A string suitable for tool responses.
     """
     fmt = (format or "markdown").lower()
-
-    # Normalize row cap
     if max_rows is None:
-        max_rows = MAX_MARKDOWN_ROWS if fmt == "markdown" else MAX_MARKDOWN_ROWS
-
-    total_rows = 0 if df is None else int(df.shape[0])
-    rows_to_show = 0 if df is None else min(total_rows, max_rows)
-    truncated = total_rows > rows_to_show
-    df_display = df.head(rows_to_show) if df is not None else pd.DataFrame()
-
-    if fmt == "markdown":
-        header = ""
-        if meta:
-            # Render a compact meta header
-            lines = ["Meta:"]
-            for k, v in meta.items():
-                lines.append(f"- {k}: {v}")
-            header = "\n".join(lines) + "\n\n"
-        return header + format_df_to_markdown(df_display, max_rows=max_rows)
-
-    if fmt == "csv":
-        try:
-            return df_display.to_csv(index=False)
-        except Exception as e:
-            logger.error("Error converting DataFrame to CSV: %s", e, exc_info=True)
-            return "Error: Could not format data into CSV."
-
-    if fmt == "json":
-        try:
-            payload = {
-                "data": [] if df_display is None else df_display.to_dict(orient="records"),
-                "meta": {
-                    **(meta or {}),
-                    "total_rows": total_rows,
-                    "returned_rows": rows_to_show,
-                    "truncated": truncated,
-                    "columns": [] if df_display is None else list(df_display.columns),
-                },
-            }
-            return json.dumps(payload, ensure_ascii=False)
-        except Exception as e:
-            logger.error("Error converting DataFrame to JSON: %s", e, exc_info=True)
-            return "Error: Could not format data into JSON."
-
-    # Fallback to markdown if unknown format
-    logger.warning("Unknown format '%s', falling back to markdown", fmt)
-    return format_df_to_markdown(df_display, max_rows=max_rows)
+        max_rows = MAX_MARKDOWN_ROWS
+
+    if df is None:
+        df = _EMPTY_DF
+    total_rows = int(df.shape[0])
+    # Empty and short frames are shown as they are, without slicing a copy
+    df_display = df.head(max_rows) if total_rows > max_rows else df
+
+    formatter = _FORMATTERS.get(fmt)
+    if formatter is None:
+        # Fallback to markdown if unknown format
+        logger.warning("Unknown format '%s', falling back to markdown", fmt)
+        return format_df_to_markdown(df_display, max_rows=max_rows)
+    return formatter(df_display, total_rows, max_rows, meta)
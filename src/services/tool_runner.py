@@ -1,11 +1,61 @@
 """Common error handling for MCP tools."""
+import asyncio
+import atexit
+import itertools
 import logging
-from typing import Callable
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 from src.data_source_interface import NoDataFoundError, LoginError, DataSourceError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WORKERS = 8
+# Full tracebacks are logged for the first few unexpected errors only; later ones get one line,
+# so a prompt that keeps triggering the same failure cannot flood the log
+MAX_LOGGED_TRACEBACKS = 10
+
+# Expected error type -> (log level, log label, user-facing message prefix); subclasses are
+# matched through their MRO, so NoDataFoundError/LoginError win over DataSourceError
+_ERROR_MAP = {
+    NoDataFoundError: (logging.WARNING, "No data found", "Error: "),
+    LoginError: (logging.ERROR, "Login error", "Error: Could not connect to data source. "),
+    DataSourceError: (logging.ERROR, "Data source error", "Error: An error occurred while fetching data. "),
+    ValueError: (logging.WARNING, "Validation error", "Error: Invalid input parameter. "),
+}
+
+_unexpected_errors = itertools.count()
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _worker_count() -> int:
+    """Reads the worker pool size from A_SHARE_BAOSTOCK_WORKERS, falling back to DEFAULT_WORKERS."""
+    raw = os.getenv("A_SHARE_BAOSTOCK_WORKERS")
+    if not raw:
+        return DEFAULT_WORKERS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid A_SHARE_BAOSTOCK_WORKERS=%r, using %d", raw, DEFAULT_WORKERS)
+        return DEFAULT_WORKERS
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the shared, bounded worker pool for blocking tool calls, creating it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_worker_count(), thread_name_prefix="baostock"
+                )
+                atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+    return _EXECUTOR
+
 
 def run_tool_with_handling(action: Callable[[], str], context: str) -> str:
     """
@@ -17,18 +67,25 @@ def run_tool_with_handling(action: Callable[[], str], context: str) -> str:
     """
     try:
         return action()
-    except NoDataFoundError as e:
-        logger.warning(f"{context}: No data found: {e}")
-        return f"Error: {e}"
-    except LoginError as e:
-        logger.error(f"{context}: Login error: {e}")
-        return f"Error: Could not connect to data source. {e}"
-    except DataSourceError as e:
-        logger.error(f"{context}: Data source error: {e}")
-        return f"Error: An error occurred while fetching data. {e}"
-    except ValueError as e:
-        logger.warning(f"{context}: Validation error: {e}")
-        return f"Error: Invalid input parameter. {e}"
-    except Exception as e:  # Catch-all
-        logger.exception(f"{context}: Unexpected error: {e}")
+    except Exception as e:
+        for cls in type(e).__mro__:
+            handling = _ERROR_MAP.get(cls)
+            if handling is not None:
+                level, label, prefix = handling
+                logger.log(level, "%s: %s: %s", context, label, e)
+                return f"{prefix}{e}"
+        if next(_unexpected_errors) < MAX_LOGGED_TRACEBACKS:
+            # exception() appends the traceback, which already ends with the error message
+            logger.exception("%s: Unexpected error", context)
+        else:
+            logger.error("%s: Unexpected error: %r", context, e)
         return f"Error: An unexpected error occurred: {e}"
+
+
+async def run_tool_with_handling_async(action: Callable[[], str], context: str) -> str:
+    """
+    Same as run_tool_with_handling, but runs the action on the shared worker pool
+    so blocking Baostock calls do not stall the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), run_tool_with_handling, action, context)
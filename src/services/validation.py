@@ -1,28 +1,41 @@
 """Validation utilities for tool inputs."""
-from typing import Iterable
+import re
+from typing import Optional, Tuple
 
-VALID_FREQS = ["d", "w", "m", "5", "15", "30", "60"]
-VALID_ADJUST_FLAGS = ["1", "2", "3"]
-VALID_FORMATS = ["markdown", "json", "csv"]
-VALID_YEAR_TYPES = ["report", "operate"]
-VALID_RESERVE_YEAR_TYPES = ["0", "1", "2"]
+# Ordered tuples for error messages, frozensets for the membership checks
+VALID_FREQS_DISPLAY = ("d", "w", "m", "5", "15", "30", "60")
+VALID_ADJUST_FLAGS_DISPLAY = ("1", "2", "3")
+VALID_FORMATS_DISPLAY = ("markdown", "json", "csv", "toon")
+VALID_YEAR_TYPES_DISPLAY = ("report", "operate")
+VALID_RESERVE_YEAR_TYPES_DISPLAY = ("0", "1", "2")
 
+VALID_FREQS = frozenset(VALID_FREQS_DISPLAY)
+VALID_ADJUST_FLAGS = frozenset(VALID_ADJUST_FLAGS_DISPLAY)
+VALID_FORMATS = frozenset(VALID_FORMATS_DISPLAY)
+VALID_YEAR_TYPES = frozenset(VALID_YEAR_TYPES_DISPLAY)
+VALID_RESERVE_YEAR_TYPES = frozenset(VALID_RESERVE_YEAR_TYPES_DISPLAY)
 
-def _ensure_in(value: str, allowed: Iterable[str], label: str) -> None:
+# Date shapes accepted by Baostock; checked up front so malformed input never reaches the network
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+_MONTH_RE = re.compile(r"\d{4}-\d{2}", re.ASCII)
+_YEAR_RE = re.compile(r"\d{4}", re.ASCII)
+
+
+def _ensure_in(value: str, allowed: frozenset, display: Tuple[str, ...], label: str) -> None:
     if value not in allowed:
-        raise ValueError(f"Invalid {label} '{value}'. Valid options are: {list(allowed)}")
+        raise ValueError(f"Invalid {label} '{value}'. Valid options are: {list(display)}")
 
 
 def validate_frequency(frequency: str) -> None:
-    _ensure_in(frequency, VALID_FREQS, "frequency")
+    _ensure_in(frequency, VALID_FREQS, VALID_FREQS_DISPLAY, "frequency")
 
 
 def validate_adjust_flag(adjust_flag: str) -> None:
-    _ensure_in(adjust_flag, VALID_ADJUST_FLAGS, "adjust_flag")
+    _ensure_in(adjust_flag, VALID_ADJUST_FLAGS, VALID_ADJUST_FLAGS_DISPLAY, "adjust_flag")
 
 
 def validate_output_format(fmt: str) -> None:
-    _ensure_in(fmt, VALID_FORMATS, "format")
+    _ensure_in(fmt, VALID_FORMATS, VALID_FORMATS_DISPLAY, "format")
 
 
 def validate_year(year: str) -> None:
@@ -31,7 +44,7 @@ def validate_year(year: str) -> None:
 
 
 def validate_year_type(year_type: str) -> None:
-    _ensure_in(year_type, VALID_YEAR_TYPES, "year_type")
+    _ensure_in(year_type, VALID_YEAR_TYPES, VALID_YEAR_TYPES_DISPLAY, "year_type")
 
 
 def validate_quarter(quarter: int) -> None:
@@ -52,7 +65,37 @@ def validate_index_key(value: str, mapping: dict) -> str:
 
 
 def validate_year_type_reserve(year_type: str) -> None:
-    _ensure_in(year_type, VALID_RESERVE_YEAR_TYPES, "year_type")
+    _ensure_in(year_type, VALID_RESERVE_YEAR_TYPES, VALID_RESERVE_YEAR_TYPES_DISPLAY, "year_type")
+
+
+def _ensure_format(value: Optional[str], pattern: re.Pattern, shape: str, label: str) -> None:
+    if value is not None and value != "" and not (isinstance(value, str) and pattern.fullmatch(value)):
+        raise ValueError(f"Invalid {label} '{value}'. Expected '{shape}' format.")
+
+
+def validate_optional_date(value: Optional[str], label: str = "date") -> None:
+    _ensure_format(value, _DATE_RE, "YYYY-MM-DD", label)
+
+
+def validate_date(value: str, label: str = "date") -> None:
+    """Like validate_optional_date, but the date is required."""
+    validate_non_empty_str(value, label)
+    validate_optional_date(value, label)
+
+
+def validate_optional_month(value: Optional[str], label: str) -> None:
+    _ensure_format(value, _MONTH_RE, "YYYY-MM", label)
+
+
+def validate_optional_year(value: Optional[str], label: str) -> None:
+    _ensure_format(value, _YEAR_RE, "YYYY", label)
+
+
+def validate_batch_size(items: list, maximum: int, label: str) -> None:
+    if not items:
+        raise ValueError(f"'{label}' must be a non-empty list.")
+    if len(items) > maximum:
+        raise ValueError(f"Too many {label}: {len(items)}. At most {maximum} per call.")
 
 
 def validate_limit(limit: int) -> None:
@@ -11,6 +11,28 @@ from src.use_cases.helpers import normalize_index_code_logic, normalize_stock_co
 
 logger = logging.getLogger(__name__)
 
+# Static tables shown by list_tool_constants: kind -> (value, meaning) rows
+_TOOL_CONSTANTS = {
+    "frequency": [
+        ("d", "daily"), ("w", "weekly"), ("m", "monthly"),
+        ("5", "5 minutes"), ("15", "15 minutes"), ("30", "30 minutes"), ("60", "60 minutes"),
+    ],
+    "adjust_flag": [("1", "forward adjusted"), ("2", "backward adjusted"), ("3", "unadjusted")],
+    "year_type": [("report", "announcement year"), ("operate", "ex-dividend year")],
+    "index": [("hs300", "CSI 300"), ("sz50", "SSE 50"), ("zz500", "CSI 500")],
+}
+
+
+def _as_md(title: str, rows) -> str:
+    header = f"### {title}\n\n| value | meaning |\n|---|---|\n"
+    lines = [f"| {v} | {m} |" for (v, m) in rows]
+    return header + "\n".join(lines) + "\n"
+
+
+# The content never changes, so each section (and the full listing) is rendered once at import
+_CONST_SECTIONS = {kind: _as_md(kind, rows) for kind, rows in _TOOL_CONSTANTS.items()}
+_CONST_ALL = "\n".join(_CONST_SECTIONS.values())
+
 
 def register_helpers_tools(app: FastMCP):
     """Register helper/utility tools with the MCP app."""
@@ -42,34 +64,10 @@ def register_helpers_tools(app: FastMCP):
             kind: Optional filter: 'frequency' | 'adjust_flag' | 'year_type' | 'index'. If None, show all.
         """
         logger.info("Tool 'list_tool_constants' called kind=%s", kind or "all")
-        freq = [
-            ("d", "daily"), ("w", "weekly"), ("m", "monthly"),
-            ("5", "5 minutes"), ("15", "15 minutes"), ("30", "30 minutes"), ("60", "60 minutes"),
-        ]
-        adjust = [("1", "forward adjusted"), ("2", "backward adjusted"), ("3", "unadjusted")]
-        year_type = [("report", "announcement year"), ("operate", "ex-dividend year")]
-        index = [("hs300", "CSI 300"), ("sz50", "SSE 50"), ("zz500", "CSI 500")]
-
-        sections = []
-
-        def as_md(title: str, rows):
-            if not rows:
-                return ""
-            header = f"### {title}\n\n| value | meaning |\n|---|---|\n"
-            lines = [f"| {v} | {m} |" for (v, m) in rows]
-            return header + "\n".join(lines) + "\n"
-
         k = (kind or "").strip().lower()
-        if k in ("", "frequency"):
-            sections.append(as_md("frequency", freq))
-        if k in ("", "adjust_flag"):
-            sections.append(as_md("adjust_flag", adjust))
-        if k in ("", "year_type"):
-            sections.append(as_md("year_type", year_type))
-        if k in ("", "index"):
-            sections.append(as_md("index", index))
-
-        out = "\n".join(s for s in sections if s)
-        if not out:
+        if not k:
+            return _CONST_ALL
+        section = _CONST_SECTIONS.get(k)
+        if section is None:
             return "Error: Invalid kind. Use one of 'frequency', 'adjust_flag', 'year_type', 'index'."
-        return out
+        return section
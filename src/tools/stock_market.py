@@ -7,11 +7,12 @@ from typing import List, Optional
 
 from mcp.server.fastmcp import FastMCP
 from src.data_source_interface import FinancialDataSource
-from src.services.tool_runner import run_tool_with_handling
+from src.services.tool_runner import run_tool_with_handling_async
 from src.use_cases.stock_market import (
     fetch_adjust_factor_data,
     fetch_dividend_data,
     fetch_historical_k_data,
+    fetch_historical_k_data_batch,
     fetch_stock_basic_info,
 )
 
@@ -28,7 +29,7 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
     """
 
     @app.tool()
-    def get_historical_k_data(
+    async def get_historical_k_data(
         code: str,
         start_date: str,
         end_date: str,
@@ -36,7 +37,7 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         adjust_flag: str = "3",
         fields: Optional[List[str]] = None,
         limit: int = 250,
-        format: str = "markdown",
+        format: str = "toon",
     ) -> str:
         """
         Fetches historical K-line (OHLCV) data for a Chinese A-share stock.
@@ -62,16 +63,17 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
             fields: Optional list of specific data fields to retrieve (must be valid Baostock fields).
                     If None or empty, default fields will be used (e.g., date, code, open, high, low, close, volume, amount, pctChg).
             limit: Max rows to return. Defaults to 250.
-            format: Output format: 'markdown' | 'json' | 'csv'. Defaults to 'markdown'.
+            format: Output format: 'toon' | 'markdown' | 'json' | 'csv'. Defaults to 'toon' (compact; use 'markdown' for human reading).
 
             Returns:
-                A Markdown formatted string containing the K-line data table, or an error message.
+                The K-line data table in the requested format (TOON by default), or an error message.
                 The table might be truncated if the result set is too large.
             """
         logger.info(
-            f"Tool 'get_historical_k_data' called for {code} ({start_date}-{end_date}, freq={frequency}, adj={adjust_flag}, fields={fields})"
+            "Tool 'get_historical_k_data' called for %s (%s-%s, freq=%s, adj=%s, fields=%s)",
+            code, start_date, end_date, frequency, adjust_flag, fields,
         )
-        return run_tool_with_handling(
+        return await run_tool_with_handling_async(
             lambda: fetch_historical_k_data(
                 active_data_source,
                 code=code,
@@ -87,7 +89,55 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         )
 
     @app.tool()
-    def get_stock_basic_info(code: str, fields: Optional[List[str]] = None, format: str = "markdown") -> str:
+    async def get_historical_k_data_batch(
+        codes: List[str],
+        start_date: str,
+        end_date: str,
+        frequency: str = "d",
+        adjust_flag: str = "3",
+        fields: Optional[List[str]] = None,
+        limit: int = 250,
+        format: str = "toon",
+    ) -> str:
+        """
+        Fetches historical K-line (OHLCV) data for several stocks over the same range in one call.
+
+        Args:
+            codes: Stock codes in Baostock format (e.g., ['sh.600000', 'sz.000001']); at most 50 per call.
+            start_date: Start date in 'YYYY-MM-DD' format.
+            end_date: End date in 'YYYY-MM-DD' format.
+            frequency: Data frequency, as in get_historical_k_data. Defaults to 'd'.
+            adjust_flag: Adjustment flag, as in get_historical_k_data. Defaults to '3'.
+            fields: Optional list of Baostock fields to retrieve; a 'code' column is always included.
+            limit: Max rows to return per code (the first rows of its range). Defaults to 250.
+                   The whole table is capped at 5000 rows.
+            format: Output format: 'toon' | 'markdown' | 'json' | 'csv'. Defaults to 'toon'.
+
+        Returns:
+            One table with the rows of every code that has data; codes without data, or whose
+            query failed, are listed in the meta instead.
+        """
+        logger.info(
+            "Tool 'get_historical_k_data_batch' called for %d codes (%s-%s, freq=%s, adj=%s)",
+            len(codes), start_date, end_date, frequency, adjust_flag,
+        )
+        return await run_tool_with_handling_async(
+            lambda: fetch_historical_k_data_batch(
+                active_data_source,
+                codes=codes,
+                start_date=start_date,
+                end_date=end_date,
+                frequency=frequency,
+                adjust_flag=adjust_flag,
+                fields=fields,
+                limit=limit,
+                format=format,
+            ),
+            context=f"get_historical_k_data_batch:{len(codes)}",
+        )
+
+    @app.tool()
+    async def get_stock_basic_info(code: str, fields: Optional[List[str]] = None, format: str = "markdown") -> str:
         """
         Fetches basic information for a given Chinese A-share stock.
 
@@ -100,8 +150,8 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         Returns:
             Basic stock information in the requested format.
         """
-        logger.info(f"Tool 'get_stock_basic_info' called for {code} (fields={fields})")
-        return run_tool_with_handling(
+        logger.info("Tool 'get_stock_basic_info' called for %s (fields=%s)", code, fields)
+        return await run_tool_with_handling_async(
             lambda: fetch_stock_basic_info(
                 active_data_source, code=code, fields=fields, format=format
             ),
@@ -109,7 +159,7 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         )
 
     @app.tool()
-    def get_dividend_data(code: str, year: str, year_type: str = "report", limit: int = 250, format: str = "markdown") -> str:
+    async def get_dividend_data(code: str, year: str, year_type: str = "report", limit: int = 250, format: str = "markdown") -> str:
         """
         Fetches dividend information for a given stock code and year.
 
@@ -124,8 +174,8 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         Returns:
             Dividend records table.
         """
-        logger.info(f"Tool 'get_dividend_data' called for {code}, year={year}, year_type={year_type}")
-        return run_tool_with_handling(
+        logger.info("Tool 'get_dividend_data' called for %s, year=%s, year_type=%s", code, year, year_type)
+        return await run_tool_with_handling_async(
             lambda: fetch_dividend_data(
                 active_data_source,
                 code=code,
@@ -138,7 +188,7 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
         )
 
     @app.tool()
-    def get_adjust_factor_data(code: str, start_date: str, end_date: str, limit: int = 250, format: str = "markdown") -> str:
+    async def get_adjust_factor_data(code: str, start_date: str, end_date: str, limit: int = 250, format: str = "toon") -> str:
         """
         Fetches adjustment factor data for a given stock code and date range.
         Uses Baostock's "涨跌幅复权算法" factors. Useful for calculating adjusted prices.
@@ -147,12 +197,14 @@ def register_stock_market_tools(app: FastMCP, active_data_source: FinancialDataS
             code: The stock code in Baostock format (e.g., 'sh.600000', 'sz.000001').
             start_date: Start date in 'YYYY-MM-DD' format.
             end_date: End date in 'YYYY-MM-DD' format.
+            limit: Max rows to return. Defaults to 250.
+            format: Output format: 'toon' | 'markdown' | 'json' | 'csv'. Defaults to 'toon'.
 
         Returns:
             Adjustment factors table.
         """
-        logger.info(f"Tool 'get_adjust_factor_data' called for {code} ({start_date} to {end_date})")
-        return run_tool_with_handling(
+        logger.info("Tool 'get_adjust_factor_data' called for %s (%s to %s)", code, start_date, end_date)
+        return await run_tool_with_handling_async(
             lambda: fetch_adjust_factor_data(
                 active_data_source,
                 code=code,
@@ -1,90 +1,130 @@
 """Use cases for date utility tools."""
 import calendar
+import functools
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
-from src.data_source_interface import FinancialDataSource
+from src.data_source_interface import FinancialDataSource, NoDataFoundError
+from src.services.validation import validate_date
 
+# Trade calendar columns returned by get_trade_dates
+DAY_COL = "calendar_date"
+FLAG_COL = "is_trading_day"
 
-def _fetch_trading_days(data_source: FinancialDataSource, start_date: str, end_date: str) -> pd.DataFrame:
-    return data_source.get_trade_dates(start_date=start_date, end_date=end_date)
+
+def _to_day_int(date: str) -> int:
+    """'2025-01-03' -> 20250103, so dates compare as integers."""
+    return int(date.replace("-", ""))
+
+
+def _year_calendar(data_source: FinancialDataSource, year: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns one year of the trade calendar as (dates, YYYYMMDD ints, is-trading-day mask), in date order.
+
+    Fetched per call rather than memoized here: the caching data source already keeps
+    closed years permanently and re-fetches the current one after its TTL (or
+    clear_cache()), so later calendar corrections are picked up.
+    """
+    df = data_source.get_trade_dates(start_date=f"{year}-01-01", end_date=f"{year}-12-31")
+    days = df[DAY_COL].to_numpy(dtype=object)
+    day_ints = np.fromiter((_to_day_int(d) for d in days), dtype=np.int32, count=len(days))
+    return days, day_ints, df[FLAG_COL].to_numpy() == "1"
+
+
+def _trading_calendar(data_source: FinancialDataSource, start_date: str, end_date: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the _year_calendar arrays restricted to start_date..end_date (inclusive)."""
+    parts = []
+    for year in range(int(start_date[:4]), int(end_date[:4]) + 1):
+        try:
+            parts.append(_year_calendar(data_source, year))
+        except NoDataFoundError:
+            # e.g. next year's calendar has not been published yet
+            continue
+    if not parts:
+        raise NoDataFoundError(f"No trade dates found for {start_date} to {end_date}.")
+    days, day_ints, trading = parts[0] if len(parts) == 1 else (np.concatenate(arrays) for arrays in zip(*parts))
+    lo = np.searchsorted(day_ints, _to_day_int(start_date), side="left")
+    hi = np.searchsorted(day_ints, _to_day_int(end_date), side="right")
+    return days[lo:hi], day_ints[lo:hi], trading[lo:hi]
+
+
+def _trading_days(data_source: FinancialDataSource, start_date: str, end_date: str) -> list:
+    """Returns the trading days between start_date and end_date (inclusive), in date order."""
+    days, _, trading = _trading_calendar(data_source, start_date, end_date)
+    return days[trading].tolist()
 
 
 def get_latest_trading_date(data_source: FinancialDataSource) -> str:
     today = datetime.now().strftime("%Y-%m-%d")
-    start_date = datetime.now().replace(day=1).strftime("%Y-%m-%d")
-    end_date = datetime.now().replace(day=28).strftime("%Y-%m-%d")
-    df = _fetch_trading_days(data_source, start_date=start_date, end_date=end_date)
-    valid_trading_days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
-    latest_trading_date = None
-    for dstr in valid_trading_days:
-        if dstr <= today and (latest_trading_date is None or dstr > latest_trading_date):
-            latest_trading_date = dstr
-    return latest_trading_date or today
+    start_date = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=31)).strftime("%Y-%m-%d")
+    # The range ends today and is in date order, so the last trading day in it is the latest
+    days, _, trading = _trading_calendar(data_source, start_date, today)
+    hits = np.flatnonzero(trading)
+    return days[hits[-1]] if hits.size else today
 
 
 def get_market_analysis_timeframe(period: str = "recent") -> str:
     now = datetime.now()
-    end_date = now
+    return _compute_timeframe(period, now.year, now.month, now.day)
+
+
+# Length in months of the calendar-aligned analysis periods
+_PERIOD_MONTHS = {"quarter": 3, "half_year": 6, "year": 12}
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_timeframe(period: str, year: int, month: int, day: int) -> str:
+    """Pure function of the period and today's date, so repeated calls on the same day are memoized."""
+    # Count months from year 0 so stepping back across a year boundary is plain subtraction
+    month_index = year * 12 + month - 1
     if period == "recent":
-        if now.day < 15:
-            if now.month == 1:
-                start_date = datetime(now.year - 1, 11, 1)
-            else:
-                prev_month = now.month - 1
-                start_month = prev_month if prev_month > 0 else 12
-                start_year = now.year if prev_month > 0 else now.year - 1
-                start_date = datetime(start_year, start_month, 1)
-        else:
-            start_date = datetime(now.year, now.month, 1)
-    elif period == "quarter":
-        quarter = (now.month - 1) // 3 + 1
-        start_month = (quarter - 1) * 3 + 1
-        start_date = datetime(now.year, start_month, 1)
-    elif period == "half_year":
-        start_month = 1 if now.month <= 6 else 7
-        start_date = datetime(now.year, start_month, 1)
-    elif period == "year":
-        start_date = datetime(now.year, 1, 1)
+        # Before the 15th, also cover the previous month (in January, back to November)
+        months_back = 0 if day >= 15 else (2 if month == 1 else 1)
+    elif period in _PERIOD_MONTHS:
+        months_back = (month - 1) % _PERIOD_MONTHS[period]
     else:
         raise ValueError("Invalid period. Use 'recent', 'quarter', 'half_year', or 'year'.")
-    return f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
+    start_year, start_month = divmod(month_index - months_back, 12)
+    return f"{start_year:04d}-{start_month + 1:02d}-01 至 {year:04d}-{month:02d}-{day:02d}"
 
 
 def is_trading_day(data_source: FinancialDataSource, *, date: str) -> str:
-    df = _fetch_trading_days(data_source, start_date=date, end_date=date)
-    if df.empty:
+    validate_date(date)
+    _, day_ints, trading = _year_calendar(data_source, int(date[:4]))
+    target = _to_day_int(date)
+    # The calendar is in date order, so a binary search finds the date (if it is listed)
+    i = np.searchsorted(day_ints, target)
+    if i == day_ints.size or day_ints[i] != target:
         return "未知"
-    row = df.iloc[0]
-    return "是" if str(row.get("is_trading_day", "")) == "1" else "否"
+    return "是" if trading[i] else "否"
 
 
 def previous_trading_day(data_source: FinancialDataSource, *, date: str) -> str:
+    validate_date(date)
     target = datetime.strptime(date, "%Y-%m-%d")
     start = (target - timedelta(days=31)).strftime("%Y-%m-%d")
-    df = _fetch_trading_days(data_source, start_date=start, end_date=date)
-    days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
-    prev = max([d for d in days if d < date], default=None)
-    return prev or date
+    days, day_ints, trading = _trading_calendar(data_source, start, date)
+    # The calendar is in date order, so the last match is the closest earlier trading day
+    hits = np.flatnonzero(trading & (day_ints < _to_day_int(date)))
+    return days[hits[-1]] if hits.size else date
 
 
 def next_trading_day(data_source: FinancialDataSource, *, date: str) -> str:
+    validate_date(date)
     target = datetime.strptime(date, "%Y-%m-%d")
     end = (target + timedelta(days=31)).strftime("%Y-%m-%d")
-    df = _fetch_trading_days(data_source, start_date=date, end_date=end)
-    days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
-    next_day = min([d for d in days if d > date], default=None)
-    return next_day or date
+    days, day_ints, trading = _trading_calendar(data_source, date, end)
+    hits = np.flatnonzero(trading & (day_ints > _to_day_int(date)))
+    return days[hits[0]] if hits.size else date
 
 
 def get_last_n_trading_days(data_source: FinancialDataSource, *, days: int) -> str:
     today = datetime.now()
     start = (today - timedelta(days=days * 2)).strftime("%Y-%m-%d")
     end = today.strftime("%Y-%m-%d")
-    df = _fetch_trading_days(data_source, start_date=start, end_date=end)
-    trading_days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
+    trading_days = _trading_days(data_source, start, end)
     return ", ".join(trading_days[-days:]) if trading_days else ""
 
 
@@ -92,8 +132,7 @@ def get_recent_trading_range(data_source: FinancialDataSource, *, days: int) ->
     today = datetime.now()
     start = (today - timedelta(days=days * 2)).strftime("%Y-%m-%d")
     end = today.strftime("%Y-%m-%d")
-    df = _fetch_trading_days(data_source, start_date=start, end_date=end)
-    trading_days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
+    trading_days = _trading_days(data_source, start, end)
     if not trading_days:
         return ""
     return f"{trading_days[-days]} 至 {trading_days[-1]}" if len(trading_days) >= days else f"{trading_days[0]} 至 {trading_days[-1]}"
@@ -105,8 +144,7 @@ def get_month_end_trading_dates(data_source: FinancialDataSource, *, year: int)
         last_day = calendar.monthrange(year, month)[1]
         start_date = datetime(year, month, last_day - 7).strftime("%Y-%m-%d")
         end_date = datetime(year, month, last_day).strftime("%Y-%m-%d")
-        df = _fetch_trading_days(data_source, start_date=start_date, end_date=end_date)
-        trading_days = df[df["is_trading_day"] == "1"]["calendar_date"].tolist()
+        trading_days = _trading_days(data_source, start_date, end_date)
         if trading_days:
             results.append(trading_days[-1])
     return ", ".join(results)
@@ -3,22 +3,62 @@ import re
 
 from src.services.validation import validate_non_empty_str
 
+# Compiled once; these run on every normalize_stock_code call
+_PREFIXED_CODE_RE = re.compile(r"(sh|sz)[.]?(\d{6})", re.IGNORECASE)
+_SUFFIXED_CODE_RE = re.compile(r"(\d{6})[.]?(sh|sz)", re.IGNORECASE)
+_BARE_CODE_RE = re.compile(r"(\d{6})")
+
+_EXCHANGES = ("sh", "sz")
+
+
+def _split_ascii_code(raw: str):
+    """
+    Fast path for ASCII input: splits 'sh600000', 'sh.600000', '600000sh' or '600000.SH'
+    into (exchange, number) with slicing instead of a regex. Returns None if raw is none of these.
+    """
+    n = len(raw)
+    if n == 8:
+        head, tail = raw[:2].lower(), raw[2:]
+        if head in _EXCHANGES and tail.isdigit():
+            return head, tail
+        head, tail = raw[:6], raw[6:].lower()
+        if tail in _EXCHANGES and head.isdigit():
+            return tail, head
+    elif n == 9:
+        if raw[2] == ".":
+            head, tail = raw[:2].lower(), raw[3:]
+            if head in _EXCHANGES and tail.isdigit():
+                return head, tail
+        if raw[6] == ".":
+            head, tail = raw[:6], raw[7:].lower()
+            if tail in _EXCHANGES and head.isdigit():
+                return tail, head
+    return None
+
 
 def normalize_stock_code_logic(code: str) -> str:
     validate_non_empty_str(code, "code")
     raw = code.strip()
 
-    m = re.fullmatch(r"(?i)(sh|sz)[.]?(\d{6})", raw)
+    if raw.isascii():
+        if len(raw) == 6 and raw.isdigit():
+            return f"{'sh' if raw.startswith('6') else 'sz'}.{raw}"
+        parts = _split_ascii_code(raw)
+        if parts:
+            return f"{parts[0]}.{parts[1]}"
+
+    # Regex fallback, e.g. for non-ASCII digits
+    m = _PREFIXED_CODE_RE.fullmatch(raw)
     if m:
         ex, num = m.group(1).lower(), m.group(2)
         return f"{ex}.{num}"
 
-    m2 = re.fullmatch(r"(\d{6})[.]?(?i:(sh|sz))", raw)
+    m2 = _SUFFIXED_CODE_RE.fullmatch(raw)
     if m2:
         num, ex = m2.group(1), m2.group(2).lower()
         return f"{ex}.{num}"
 
-    m3 = re.fullmatch(r"(\d{6})", raw)
+    m3 = _BARE_CODE_RE.fullmatch(raw)
     if m3:
         num = m3.group(1)
         ex = "sh" if num.startswith("6") else "sz"
@@ -1,9 +1,14 @@
 """Use cases for index and industry related tools."""
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
 from src.data_source_interface import FinancialDataSource
 from src.formatting.markdown_formatter import format_table_output
-from src.services.validation import validate_output_format, validate_index_key, validate_non_empty_str
+from src.services.validation import (
+    validate_output_format, validate_index_key, validate_non_empty_str, validate_optional_date,
+)
 
 INDEX_MAP = {
     "hs300": "hs300",
@@ -14,9 +19,37 @@ INDEX_MAP = {
     "上证50": "sz50",
 }
 
+# Index key -> FinancialDataSource method returning its constituents
+INDEX_FETCHERS = {
+    "hs300": "get_hs300_stocks",
+    "sz50": "get_sz50_stocks",
+    "zz500": "get_zz500_stocks",
+}
+
+
+def _equals_mask(series: pd.Series, value: str) -> np.ndarray:
+    """Boolean mask of series == value; for categoricals this compares the integer codes."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        position = series.cat.categories.get_indexer([value])[0]
+        if position < 0:
+            return np.zeros(len(series), dtype=bool)
+        return series.cat.codes.to_numpy() == position
+    return series.to_numpy() == value
+
+
+def _unique_sorted(series: pd.Series) -> np.ndarray:
+    """Sorted distinct non-missing values of series."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories built from the data are already distinct and sorted
+        return series.cat.remove_unused_categories().cat.categories.to_numpy()
+    values = series.to_numpy()
+    # np.unique dedups and sorts in one pass
+    return np.unique(values[pd.notna(values)])
+
 
 def fetch_stock_industry(data_source: FinancialDataSource, *, code: Optional[str], date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     df = data_source.get_stock_industry(code=code, date=date)
     meta = {"code": code or "all", "as_of": date or "latest"}
     return format_table_output(df, format=format, max_rows=limit, meta=meta)
@@ -24,36 +57,34 @@ def fetch_stock_industry(data_source: FinancialDataSource, *, code: Optional[str
 
 def fetch_index_constituents(data_source: FinancialDataSource, *, index: str, date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     key = validate_index_key(index, INDEX_MAP)
-    if key == "hs300":
-        df = data_source.get_hs300_stocks(date=date)
-    elif key == "sz50":
-        df = data_source.get_sz50_stocks(date=date)
-    else:
-        df = data_source.get_zz500_stocks(date=date)
+    df = getattr(data_source, INDEX_FETCHERS[key])(date=date)
     meta = {"index": key, "as_of": date or "latest"}
     return format_table_output(df, format=format, max_rows=limit, meta=meta)
 
 
 def fetch_list_industries(data_source: FinancialDataSource, *, date: Optional[str], format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     df = data_source.get_stock_industry(code=None, date=date)
     if df is None or df.empty:
         return "(No data available to display)"
     col = "industry" if "industry" in df.columns else df.columns[-1]
-    out = df[[col]].drop_duplicates().sort_values(by=col)
-    out = out.rename(columns={col: "industry"})
+    out = pd.DataFrame({"industry": _unique_sorted(df[col])})
     meta = {"as_of": date or "latest", "count": int(out.shape[0])}
     return format_table_output(out, format=format, max_rows=out.shape[0], meta=meta)
 
 
 def fetch_industry_members(data_source: FinancialDataSource, *, industry: str, date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     validate_non_empty_str(industry, "industry")
     df = data_source.get_stock_industry(code=None, date=date)
     if df is None or df.empty:
         return "(No data available to display)"
     col = "industry" if "industry" in df.columns else df.columns[-1]
-    filtered = df[df[col] == industry].copy()
+    # Positional numpy filter; the result is only formatted, so no defensive copy
+    filtered = df.iloc[_equals_mask(df[col], industry)]
     meta = {"industry": industry, "as_of": date or "latest"}
     return format_table_output(filtered, format=format, max_rows=limit, meta=meta)
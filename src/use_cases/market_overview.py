@@ -1,13 +1,17 @@
 """Use cases for market overview tools."""
 from typing import Optional
 
+import numpy as np
+
 from src.data_source_interface import FinancialDataSource
 from src.formatting.markdown_formatter import format_table_output
-from src.services.validation import validate_output_format, validate_non_empty_str
+from src.services.validation import validate_output_format, validate_non_empty_str, validate_optional_date
 
 
 def fetch_trade_dates(data_source: FinancialDataSource, *, start_date: Optional[str], end_date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(start_date, "start_date")
+    validate_optional_date(end_date, "end_date")
     df = data_source.get_trade_dates(start_date=start_date, end_date=end_date)
     meta = {"start_date": start_date or "default", "end_date": end_date or "default"}
     return format_table_output(df, format=format, max_rows=limit, meta=meta)
@@ -15,6 +19,7 @@ def fetch_trade_dates(data_source: FinancialDataSource, *, start_date: Optional[
 
 def fetch_all_stock(data_source: FinancialDataSource, *, date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     df = data_source.get_all_stock(date=date)
     meta = {"as_of": date or "default"}
     return format_table_output(df, format=format, max_rows=limit, meta=meta)
@@ -23,22 +28,28 @@ def fetch_all_stock(data_source: FinancialDataSource, *, date: Optional[str], li
 def fetch_search_stocks(data_source: FinancialDataSource, *, keyword: str, date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
     validate_non_empty_str(keyword, "keyword")
+    validate_optional_date(date)
     df = data_source.get_all_stock(date=date)
     if df is None or df.empty:
         return "(No data available to display)"
+    # Codes come back in lowercase Baostock form ('sh.600000'), so only the keyword needs lowering
     kw = keyword.strip().lower()
-    filtered = df[df["code"].str.lower().str.contains(kw, na=False)]
+    # np.char.find scans a fixed-width unicode array in C (missing codes become '' and never match)
+    codes = df["code"].fillna("").to_numpy(dtype=str)
+    filtered = df.iloc[np.char.find(codes, kw) >= 0]
     meta = {"keyword": keyword, "as_of": date or "current"}
     return format_table_output(filtered, format=format, max_rows=limit, meta=meta)
 
 
 def fetch_suspensions(data_source: FinancialDataSource, *, date: Optional[str], limit: int, format: str) -> str:
     validate_output_format(format)
+    validate_optional_date(date)
     df = data_source.get_all_stock(date=date)
     if df is None or df.empty:
         return "(No data available to display)"
     if "tradeStatus" not in df.columns:
         raise ValueError("'tradeStatus' column not present in data source response.")
-    suspended = df[df["tradeStatus"] == '0']
+    # Compare the raw column values; no aligned boolean Series is needed for a positional filter
+    suspended = df.iloc[df["tradeStatus"].to_numpy() == '0']
     meta = {"as_of": date or "current", "total_suspended": int(suspended.shape[0])}
     return format_table_output(suspended, format=format, max_rows=limit, meta=meta)
@@ -3,11 +3,15 @@ from typing import List, Optional
 
 import pandas as pd
 
-from src.data_source_interface import FinancialDataSource
+from src.data_source_interface import DataSourceError, FinancialDataSource, LoginError, NoDataFoundError
 from src.formatting.markdown_formatter import format_table_output
 from src.services.validation import (
     validate_adjust_flag,
+    validate_batch_size,
     validate_frequency,
+    validate_limit,
+    validate_date,
+    validate_non_empty_str,
     validate_output_format,
     validate_year,
     validate_year_type,
@@ -24,11 +28,13 @@ def fetch_historical_k_data(
     adjust_flag: str = "3",
     fields: Optional[List[str]] = None,
     limit: int = 250,
-    format: str = "markdown",
+    format: str = "toon",
 ) -> str:
     validate_frequency(frequency)
     validate_adjust_flag(adjust_flag)
     validate_output_format(format)
+    validate_date(start_date, "start_date")
+    validate_date(end_date, "end_date")
 
     df = data_source.get_historical_k_data(
         code=code,
@@ -48,6 +54,82 @@ def fetch_historical_k_data(
     return format_table_output(df, format=format, max_rows=limit, meta=meta)
 
 
+# Each code is one serial query on the shared Baostock session, so a batch holds up every
+# other tool call while it runs; both bounds keep one call short and its output readable
+MAX_BATCH_CODES = 50
+MAX_BATCH_ROWS = 5000
+
+
+def fetch_historical_k_data_batch(
+    data_source: FinancialDataSource,
+    *,
+    codes: List[str],
+    start_date: str,
+    end_date: str,
+    frequency: str = "d",
+    adjust_flag: str = "3",
+    fields: Optional[List[str]] = None,
+    limit: int = 250,
+    format: str = "toon",
+) -> str:
+    validate_frequency(frequency)
+    validate_adjust_flag(adjust_flag)
+    validate_output_format(format)
+    validate_limit(limit)
+    validate_date(start_date, "start_date")
+    validate_date(end_date, "end_date")
+    validate_batch_size(codes, MAX_BATCH_CODES, "codes")
+    for code in codes:
+        validate_non_empty_str(code, "codes")
+
+    # One query per code: Baostock has no multi-code K-data query and serializes
+    # requests on its single socket, but each code is served from the cache if seen before
+    frames, missing, failed = [], [], []
+    for code in dict.fromkeys(codes):
+        try:
+            df = data_source.get_historical_k_data(
+                code=code,
+                start_date=start_date,
+                end_date=end_date,
+                frequency=frequency,
+                adjust_flag=adjust_flag,
+                fields=fields,
+            )
+        except NoDataFoundError:
+            missing.append(code)
+            continue
+        except LoginError:
+            # Every other code would fail the same way
+            raise
+        except DataSourceError as e:
+            failed.append(f"{code} ({e})")
+            continue
+        # limit applies per code, so one long history cannot crowd out the others
+        if len(df) > limit:
+            df = df.head(limit)
+        if "code" not in df.columns:
+            # Keep rows attributable when the requested fields leave out the code
+            df.insert(0, "code", code)
+        frames.append(df)
+    if not frames:
+        if failed:
+            raise DataSourceError(f"K-data could not be fetched for any code: {'; '.join(failed)}")
+        raise NoDataFoundError(f"No K-data found for any of {len(missing)} codes ({start_date} to {end_date}).")
+
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, copy=False)
+    meta = {
+        "codes": len(frames),
+        "missing": ", ".join(missing) or "none",
+        "failed": "; ".join(failed) or "none",
+        "start_date": start_date,
+        "end_date": end_date,
+        "frequency": frequency,
+        "adjust_flag": adjust_flag,
+        "limit_per_code": limit,
+    }
+    return format_table_output(df, format=format, max_rows=MAX_BATCH_ROWS, meta=meta)
+
+
 def fetch_stock_basic_info(
     data_source: FinancialDataSource,
     *,
@@ -58,7 +140,7 @@ def fetch_stock_basic_info(
     validate_output_format(format)
     df = data_source.get_stock_basic_info(code=code, fields=fields)
     meta = {"code": code}
-    return format_table_output(df, format=format, max_rows=df.shape[0] if df is not None else 0, meta=meta)
+    return format_table_output(df, format=format, max_rows=0 if df is None else len(df), meta=meta)
 
 
 def fetch_dividend_data(
@@ -86,7 +168,7 @@ def fetch_adjust_factor_data(
     start_date: str,
     end_date: str,
     limit: int = 250,
-    format: str = "markdown",
+    format: str = "toon",
 ) -> str:
     validate_output_format(format)
     df = data_source.get_adjust_factor_data(code=code, start_date=start_date, end_date=end_date)
@@ -1,69 +1,230 @@
-# Utility functions, including the Baostock login context manager and logging setup
-import baostock as bs
-import os
-import sys
+# Utility functions, including the persistent Baostock session and logging setup
+import atexit
+import io
 import logging
-from contextlib import contextmanager
-from .data_source_interface import LoginError
+import queue
+import socket
+import threading
+import time
+from contextlib import contextmanager, redirect_stdout
+from logging.handlers import QueueHandler, QueueListener
+from .data_source_interface import DataSourceError, LoginError
 
 # --- Logging Setup ---
+_log_listener = None
+
+
 def setup_logging(level=logging.INFO):
-    """Configures basic logging for the application."""
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    """
+    Configures basic logging for the application.
+
+    Records are put on a queue and written to stderr by a background thread, so tool
+    calls on the worker pool never wait on the stream handler's lock or the write itself.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    ))
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Only merges the message arguments (and traceback) in the calling thread; the full
+    # line is formatted by stream_handler on the listener thread
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Flushes queued records on exit
+    atexit.register(_log_listener.stop)
     # Optionally silence logs from dependencies if they are too verbose
     # logging.getLogger("mcp").setLevel(logging.WARNING)
 
 # Get a logger instance for this module (optional, but good practice)
 logger = logging.getLogger(__name__)
 
+# --- Baostock Session ---
+# baostock (and the pandas it pulls in) is imported where the session first needs it, so
+# importing this module for setup_logging or the context manager stays cheap
+# Seconds a login may sit unused before it is re-established (the server may drop idle connections)
+SESSION_MAX_IDLE_SECONDS = 600
+# Seconds between keepalive queries on an idle session; below the idle limit, so a
+# pinged session never counts as idle and the next tool call skips the re-login
+SESSION_KEEPALIVE_SECONDS = 300
+
+
+class _BaostockSession:
+    """
+    Keeps a single Baostock login open across calls instead of logging in and out every time.
+
+    Baostock keeps one process-wide socket, so only one thread may use it at a time.
+    Tool calls run on a worker pool (see services/tool_runner.py); `lock` serializes them.
+    """
+
+    __slots__ = (
+        "lock", "_max_idle_seconds", "_keepalive_seconds", "_logged_in", "_last_used",
+        "_atexit_registered", "_keepalive_thread", "_stopped",
+    )
+
+    def __init__(self, max_idle_seconds: float, keepalive_seconds: float):
+        self.lock = threading.RLock()
+        self._max_idle_seconds = max_idle_seconds
+        self._keepalive_seconds = keepalive_seconds
+        self._logged_in = False
+        self._last_used = 0.0
+        self._atexit_registered = False
+        self._keepalive_thread = None
+        self._stopped = threading.Event()
+
+    def ensure_login(self) -> None:
+        """Logs in unless a fresh session is already open. The caller must hold `lock`."""
+        if self._logged_in and time.monotonic() - self._last_used < self._max_idle_seconds:
+            return
+        if self._logged_in:
+            logger.debug("Baostock session idle for too long, logging in again.")
+            self.invalidate()
+        self._close_socket()
+
+        import baostock as bs
+
+        logger.debug("Attempting Baostock login...")
+        lg = bs.login()
+        logger.debug("Login result: code=%s, msg=%s", lg.error_code, lg.error_msg)
+
+        if lg.error_code != '0':
+            # Log error before raising
+            logger.error("Baostock login failed: %s", lg.error_msg)
+            raise LoginError(f"Baostock login failed: {lg.error_msg}")
+
+        logger.info("Baostock login successful.")
+        self._tune_socket()
+        self._logged_in = True
+        self.touch()
+        if not self._atexit_registered:
+            atexit.register(self.logout)
+            self._atexit_registered = True
+        self._start_keepalive()
+
+    def touch(self) -> None:
+        self._last_used = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Forgets the current login so the next call logs in again."""
+        self._logged_in = False
+
+    def _start_keepalive(self) -> None:
+        if self._keepalive_thread is None and self._keepalive_seconds > 0:
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop, name="baostock-keepalive", daemon=True)
+            self._keepalive_thread.start()
+
+    def _keepalive_loop(self) -> None:
+        while not self._stopped.wait(self._keepalive_seconds):
+            self.ping()
+
+    def ping(self) -> None:
+        """
+        Runs a cheap query on an idle open session so the server does not drop it.
+        Skipped while a tool call holds the session, which keeps it alive anyway.
+        """
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            if not self._logged_in or time.monotonic() - self._last_used < self._keepalive_seconds:
+                return
+            import baostock as bs
+
+            today = time.strftime("%Y-%m-%d")
+            try:
+                with redirect_stdout(io.StringIO()):
+                    rs = bs.query_trade_dates(start_date=today, end_date=today)
+            except Exception as e:
+                logger.debug("Baostock keepalive failed: %s", e)
+                rs = None
+            if rs is None or rs.error_code != '0':
+                # Log in again on the next call rather than reusing a connection that may be gone
+                self.invalidate()
+                return
+            self.touch()
+        finally:
+            self.lock.release()
+
+    def logout(self) -> None:
+        """Logs out if a session is open (registered with atexit on first login)."""
+        self._stopped.set()
+        with self.lock:
+            if not self._logged_in:
+                return
+            self._logged_in = False
+            import baostock as bs
+
+            logger.debug("Attempting Baostock logout...")
+            try:
+                with redirect_stdout(io.StringIO()):
+                    bs.logout()
+            except Exception as e:
+                logger.debug("Baostock logout failed: %s", e)
+                return
+            logger.info("Baostock logout successful.")
+
+    @staticmethod
+    def _tune_socket() -> None:
+        # Every query reuses the socket opened by bs.login(). Send small requests immediately
+        # (no Nagle delay) and let the OS detect a dead peer on an otherwise idle connection.
+        import baostock.common.context as bs_context
+
+        sock = getattr(bs_context, "default_socket", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as e:
+            logger.debug("Could not set Baostock socket options: %s", e)
+
+    @staticmethod
+    def _close_socket() -> None:
+        # Closes a socket left behind by a broken session; bs.login() opens a new one
+        import baostock.common.context as bs_context
+
+        sock = getattr(bs_context, "default_socket", None)
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+
+_session = _BaostockSession(
+    max_idle_seconds=SESSION_MAX_IDLE_SECONDS, keepalive_seconds=SESSION_KEEPALIVE_SECONDS)
+
+
 # --- Baostock Context Manager ---
 @contextmanager
 def baostock_login_context():
-    """Context manager to handle Baostock login and logout, suppressing stdout messages."""
-    # Redirect stdout to suppress login/logout messages
-    original_stdout_fd = sys.stdout.fileno()
-    saved_stdout_fd = os.dup(original_stdout_fd)
-    devnull_fd = os.open(os.devnull, os.O_WRONLY)
-
-    os.dup2(devnull_fd, original_stdout_fd)
-    os.close(devnull_fd)
-
-    logger.debug("Attempting Baostock login...")
-    lg = bs.login()
-    logger.debug(f"Login result: code={lg.error_code}, msg={lg.error_msg}")
-
-    # Restore stdout
-    os.dup2(saved_stdout_fd, original_stdout_fd)
-    os.close(saved_stdout_fd)
-
-    if lg.error_code != '0':
-        # Log error before raising
-        logger.error(f"Baostock login failed: {lg.error_msg}")
-        raise LoginError(f"Baostock login failed: {lg.error_msg}")
-
-    logger.info("Baostock login successful.")
-    try:
-        yield  # API calls happen here
-    finally:
-        # Redirect stdout again for logout
-        original_stdout_fd = sys.stdout.fileno()
-        saved_stdout_fd = os.dup(original_stdout_fd)
-        devnull_fd = os.open(os.devnull, os.O_WRONLY)
-
-        os.dup2(devnull_fd, original_stdout_fd)
-        os.close(devnull_fd)
-
-        logger.debug("Attempting Baostock logout...")
-        bs.logout()
-        logger.debug("Logout completed.")
-
-        # Restore stdout
-        os.dup2(saved_stdout_fd, original_stdout_fd)
-        os.close(saved_stdout_fd)
-        logger.info("Baostock logout successful.")
+    """
+    Context manager that provides exclusive use of a logged-in Baostock session, suppressing stdout messages.
+
+    The login is kept open after the block exits and reused by the next call. Errors
+    Baostock reported for the query itself (DataSourceError, incl. "no data") and invalid
+    input leave it open. Anything else, e.g. a lost session, a socket error or an
+    unexpected failure, drops it so the next call logs in again.
+    """
+    # Baostock print()s status and error messages. sys.stdout is swapped rather than the
+    # stdout file descriptor, because the MCP stdio transport keeps writing to fd 1 from
+    # the event loop thread while we are using the session.
+    with _session.lock, redirect_stdout(io.StringIO()):
+        _session.ensure_login()
+        try:
+            yield  # API calls happen here
+        except (DataSourceError, ValueError):
+            raise
+        except BaseException:
+            _session.invalidate()
+            raise
+        finally:
+            _session.touch()
 
 # You can add other utility functions or classes here if needed
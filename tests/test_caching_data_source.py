@@ -0,0 +1,79 @@
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src import caching_data_source
+from src.caching_data_source import CachingDataSource
+
+
+class _FakeSource:
+    """Counts calls; get_adjust_factor_data blocks until `release` is set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_adjust_factor_data(self, code, start_date, end_date):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        return pd.DataFrame({"code": [code], "adjustFactor": [1.0]})
+
+    def get_trade_dates(self, start_date=None, end_date=None):
+        self.calls += 1
+        return pd.DataFrame({"calendar_date": [start_date], "is_trading_day": ["1"]})
+
+
+def test_concurrent_identical_calls_share_one_fetch(monkeypatch):
+    callers = 4
+    waiting = threading.Semaphore(0)
+
+    class _CountingFuture(Future):
+        def result(self, timeout=None):
+            waiting.release()
+            return super().result(timeout)
+
+    # Count the callers that block on the owner's future instead of fetching themselves
+    monkeypatch.setattr(caching_data_source, "Future", _CountingFuture)
+    result = object()  # not a DataFrame, so it is handed out as-is and identity can be checked
+
+    class _BlockingSource:
+        calls = 0
+
+        def get_adjust_factor_data(self, code, start_date, end_date):
+            _BlockingSource.calls += 1
+            # Hold the fetch until every other caller is waiting on it
+            for _ in range(callers - 1):
+                assert waiting.acquire(timeout=5)
+            return result
+
+    ds = CachingDataSource(_BlockingSource())
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(ds.get_adjust_factor_data, "sh.600000", "2024-01-01", "2024-01-31")
+                   for _ in range(callers)]
+        results = [f.result(timeout=10) for f in futures]
+    assert _BlockingSource.calls == 1
+    assert all(r is result for r in results)
+
+
+def test_failure_before_fetch_does_not_leave_a_stuck_in_flight_entry():
+    source = _FakeSource()
+    source.release.set()
+    ds = CachingDataSource(source)
+    # end_date is not a str, so the TTL lookup raises TypeError
+    for _ in range(2):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with pytest.raises(TypeError):
+                pool.submit(ds.get_trade_dates, "2024-01-01", 20240101).result(timeout=5)
+    assert source.calls == 0
+
+
+def test_adjust_factors_keep_the_default_ttl():
+    ds = CachingDataSource(_FakeSource())
+    params = {"code": "sh.600000", "start_date": "2020-01-01", "end_date": "2020-12-31"}
+    assert ds._ttl_for("get_adjust_factor_data", params) is None
+    assert ds._ttl_for("get_trade_dates", params) == math.inf
@@ -0,0 +1,26 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.formatting.markdown_formatter import format_table_output
+
+
+def test_json_floats_use_shortest_repr():
+    out = format_table_output(pd.DataFrame({"close": [1234.56]}), format="json")
+    assert '"close": 1234.56}' in out
+    assert json.loads(out)["data"] == [{"close": 1234.56}]
+
+
+def test_json_missing_values_and_types():
+    df = pd.DataFrame({
+        "code": pd.Categorical(["sh.600000", None]),
+        "volume": [100, 200],
+        "pctChg": [np.nan, -1.5],
+        "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+    })
+    data = json.loads(format_table_output(df, format="json"))["data"]
+    assert data == [
+        {"code": "sh.600000", "volume": 100, "pctChg": None, "date": "2024-01-02T00:00:00"},
+        {"code": None, "volume": 200, "pctChg": -1.5, "date": "2024-01-03T00:00:00"},
+    ]
@@ -0,0 +1,38 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src.use_cases import stock_market
+from src.use_cases.stock_market import MAX_BATCH_CODES, fetch_historical_k_data_batch
+
+
+class _FakeKData:
+    def __init__(self, rows_per_code):
+        self.rows_per_code = rows_per_code
+        self.calls = 0
+
+    def get_historical_k_data(self, code, start_date, end_date, frequency, adjust_flag, fields):
+        self.calls += 1
+        return pd.DataFrame({"date": ["2024-01-02"] * self.rows_per_code, "close": [10.0] * self.rows_per_code})
+
+
+def _batch(source, codes, **kwargs):
+    return fetch_historical_k_data_batch(
+        source, codes=codes, start_date="2024-01-01", end_date="2024-12-31", format="json", **kwargs)
+
+
+def test_batch_rejects_too_many_codes_before_querying():
+    source = _FakeKData(rows_per_code=1)
+    codes = [f"sh.{600000 + i}" for i in range(MAX_BATCH_CODES + 1)]
+    with pytest.raises(ValueError, match="Too many codes"):
+        _batch(source, codes)
+    assert source.calls == 0
+
+
+def test_batch_caps_total_rows(monkeypatch):
+    monkeypatch.setattr(stock_market, "MAX_BATCH_ROWS", 25)
+    out = json.loads(_batch(_FakeKData(rows_per_code=10), ["sh.600000", "sh.600001", "sh.600002"], limit=10))
+    assert out["meta"]["total_rows"] == 30
+    assert out["meta"]["returned_rows"] == 25
+    assert out["meta"]["truncated"] is True